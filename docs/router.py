@@ -9,16 +9,31 @@ Features
 - Shared HTTP worker pool per node with streaming support (NDJSON lines, SSE, base64 chunks)
 - Service helpers covering asr.* events and generic relay.http requests
 - Curses dashboard listing all active addresses, queue depth, and recent activity
+
+Performance notes
+- The dashboard/render paths are I/O- and allocation-bound, not compute-bound:
+  they format short strings from small dicts and push them to a terminal.
+  There is no numeric inner loop for a JIT (Numba/Cython) to speed up, and the
+  extra import cost would only slow startup. Optimization work here should
+  target cell-diffing (skip unchanged rows), caching formatted strings/QR
+  renders, and bounded deques for activity filtering instead.
+- Outbound DMs are coalesced where they meet the sidecar pipe (one wakeup and
+  one write per burst), not by wrapping them in a batch envelope: clients
+  decode exactly one relay.* event per DM, so the wire format stays as is.
 """
 
 import argparse
 import asyncio
 import atexit
 import base64
-import codecs
 import contextlib
+import errno
+import functools
 import hashlib
+import heapq
 import hmac
+import http.cookiejar
+import itertools
 import json
 import logging
 import math
@@ -26,12 +41,15 @@ import os
 import queue
 import re
 import secrets
+import selectors
 import shlex
 import shutil
 import signal
 import socket
+import struct
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import urllib.parse
@@ -41,7 +59,7 @@ import platform
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Deque, Dict, IO, List, Optional, Tuple
-from collections import deque
+from collections import OrderedDict, deque
 
 # ──────────────────────────────────────────────────────────────
 # Lightweight venv bootstrap so the router stays self-contained
@@ -107,6 +125,7 @@ if not BOOTSTRAP_SKIPPED:
     _ensure_deps()
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
 try:
     import qrcode  # type: ignore
 except Exception:  # pragma: no cover
@@ -115,6 +134,112 @@ try:
     import nats  # type: ignore
 except Exception:  # pragma: no cover
     nats = None  # type: ignore
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+try:
+    import pybase64  # type: ignore
+except Exception:  # pragma: no cover
+    pybase64 = None  # type: ignore
+
+
+def _json_loads(raw: Any) -> Any:
+    """Decode JSON from str/bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps_bytes(payload: Any) -> bytes:
+    """Encode compact JSON as UTF-8 bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _json_dumps_pretty(payload: Any) -> bytes:
+    """Encode 2-space indented JSON as bytes, using orjson when it is installed.
+
+    orjson output is only used when it is pure ASCII, matching json.dumps'
+    escaping so files stay readable under any locale encoding.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            if data.isascii():
+                return data
+        except TypeError:
+            pass
+    return json.dumps(payload, indent=2).encode("ascii")
+
+
+def _b64decode(value: Any) -> bytes:
+    """Lenient base64 decode (non-alphabet chars skipped), SIMD via pybase64 when installed."""
+    if pybase64 is not None:
+        return pybase64.b64decode(value, validate=False)
+    return base64.b64decode(value, validate=False)
+
+
+def _b64encode(raw: Any) -> str:
+    """Base64-encode bytes to an ASCII str, SIMD via pybase64 when installed."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(raw)
+    return base64.b64encode(raw).decode("ascii")
+
+
+def _b64decode_chunks(chunks: List[Any]) -> bytes:
+    """Decode a list of base64 chunks into one body.
+
+    When every chunk but the last is a whole, unpadded quantum the text is
+    joined and decoded in a single pass; otherwise each chunk is decoded on
+    its own (a padded chunk mid-stream would end a joined decode early).
+    """
+    texts = [str(c) for c in chunks if c is not None]
+    if all(len(t) % 4 == 0 and not t.endswith("=") for t in texts[:-1]):
+        return _b64decode("".join(texts))
+    return b"".join(_b64decode(t) for t in texts)
+
+
+# Relay requests keep re-parsing the same handful of target/base URLs;
+# ParseResult is an immutable tuple, so sharing cached results is safe.
+_parse_url = functools.lru_cache(maxsize=1024)(urllib.parse.urlparse)
+
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+_DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443}
+
+
+def _url_port(parsed: urllib.parse.ParseResult) -> int:
+    """Explicit port of a parsed URL, else the scheme default (80 when unknown)."""
+    port = parsed.port
+    if port is None:
+        return _DEFAULT_PORTS.get(parsed.scheme, 80)
+    return port
+
+
+@functools.lru_cache(maxsize=1024)
+def _port_of_url(url: str) -> int:
+    """_url_port(_parse_url(url)), memoized; raises ValueError for a bad port."""
+    return _url_port(_parse_url(url))
+
+
+def _b64_decoded_len(value: Any) -> int:
+    """Size of the bytes a base64 string decodes to, without decoding it."""
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("ascii", errors="ignore")
+    text = str(value).rstrip()
+    pad = 2 if text.endswith("==") else 1 if text.endswith("=") else 0
+    return max(0, (len(text) // 4) * 3 - pad)
+
+
+def _raw_body_len(body: Any) -> int:
+    """Length of a locally assembled upload body: bytes or a spooled file."""
+    if hasattr(body, "seek"):
+        return os.fstat(body.fileno()).st_size
+    return len(body)
 
 
 @dataclass
@@ -836,6 +961,31 @@ SERVICE_TARGETS = {
         "endpoint": "http://127.0.0.1:5000",
     },
 }
+
+
+@functools.lru_cache(maxsize=None)
+def _default_aliases(service: str) -> Tuple[str, ...]:
+    """Deduplicated SERVICE_TARGETS aliases for service (always includes service)."""
+    info = SERVICE_TARGETS.get(service)
+    if not info:
+        return (service,)
+    return tuple(dict.fromkeys([*info.get("aliases", []), service]))
+
+
+def _build_service_alias_index() -> Dict[str, str]:
+    """Normalized alias -> service; the first service listing an alias owns it."""
+    index: Dict[str, str] = {}
+    for service_name, info in SERVICE_TARGETS.items():
+        for alias in info.get("aliases", ()):
+            key = str(alias or "").strip().lower()
+            if key:
+                index.setdefault(key, service_name)
+    return index
+
+
+SERVICE_ALIAS_INDEX = _build_service_alias_index()
+
+
 MARKETPLACE_VISIBILITY = {"public", "friends", "private"}
 MARKETPLACE_TRANSPORT_PREFERENCES = {"auto", "cloudflare", "nats", "nkn", "local", "upnp"}
 NATS_SUBJECT_PATTERN = re.compile(r"^[A-Za-z0-9_.>*-]+$")
@@ -2644,6 +2794,18 @@ class ServiceWatchdog:
         return any(target in segment for segment in parts[1:])
 
 
+# DEFINITIONS is fixed at import; snapshot the names and a by-name index once.
+SERVICE_NAMES: Tuple[str, ...] = tuple(definition.name for definition in ServiceWatchdog.DEFINITIONS)
+SERVICE_NAME_SET = frozenset(SERVICE_NAMES)
+SERVICE_DEFINITIONS_BY_NAME: Dict[str, ServiceDefinition] = {
+    definition.name: definition for definition in ServiceWatchdog.DEFINITIONS
+}
+# Log file per service, for the status and port-detection polling paths.
+SERVICE_LOG_PATHS: Dict[str, Path] = {
+    name: LOGS_ROOT / f"{name}.log" for name in dict.fromkeys((*SERVICE_NAMES, *SERVICE_TARGETS))
+}
+
+
 # Router logging setup
 ROUTER_LOG = LOGS_ROOT / "router.log"
 ROUTER_LOG.parent.mkdir(parents=True, exist_ok=True)
@@ -2836,7 +2998,6 @@ def _normalize_service_relay_sections(raw_cfg: Dict[str, Any], defaults: Dict[st
             warnings.append(f"nodes[{idx}].seed_hex ignored (invalid seed)")
             changed = True
 
-    service_names = [definition.name for definition in ServiceWatchdog.DEFINITIONS]
     default_relays = defaults.get("service_relays", {}) if isinstance(defaults.get("service_relays"), dict) else {}
 
     normalized_relays: Dict[str, dict] = {}
@@ -2844,7 +3005,7 @@ def _normalize_service_relay_sections(raw_cfg: Dict[str, Any], defaults: Dict[st
     normalized_nodes: List[dict] = []
     now = int(time.time())
 
-    for service_name in service_names:
+    for service_name in SERVICE_NAMES:
         default_entry = default_relays.get(service_name, {})
         entry_value = raw_relays.get(service_name, {})
         entry = entry_value if isinstance(entry_value, dict) else {}
@@ -3121,8 +3282,7 @@ def _default_config() -> dict:
     targets = dict(DEFAULT_TARGETS)
     service_publication = _default_service_publication()
 
-    for definition in ServiceWatchdog.DEFINITIONS:
-        svc = definition.name
+    for svc in SERVICE_NAMES:
         seed = generate_seed_hex()
         name = Router._relay_name_static(svc, seed)
         relay_entry = {
@@ -3712,6 +3872,10 @@ class Hydra:
 # ──────────────────────────────────────────────────────────────
 # Enhanced Nested Menu UI
 # ──────────────────────────────────────────────────────────────
+# Hydra feed intensity per activity kind.
+_ACTIVITY_INTENSITY = {"IN": 0.6, "OUT": 0.4, "ERR": 0.9}
+
+
 class EnhancedUI:
     """Enhanced nested menu interface with Config, Statistics, Address Book, Ingress, and Egress views."""
 
@@ -4049,23 +4213,11 @@ class EnhancedUI:
 
     def bump(self, node_id: str, kind: str, msg: str, nkn_addr: str = "", bytes_sent: int = 0,
              service: Optional[str] = None, bytes_in: int = 0, duration_s: float = 0.0):
-        target = self.nodes.get(node_id)
-        if target:
-            target["last"] = msg
-            if kind == "IN":
-                target["in"] += 1
-            elif kind == "OUT":
-                target["out"] += 1
-            elif kind == "ERR":
-                target["err"] += 1
-
         ts = time.strftime("%H:%M:%S")
-        source = target.get("name") if target else node_id
-        self.activity.append((ts, source or node_id, kind, msg))
+        source = self._note_activity(node_id, kind, msg, ts)
 
         # Feed activity to hydra (intensity based on kind)
-        intensity = {"IN": 0.6, "OUT": 0.4, "ERR": 0.9}.get(kind, 0.3)
-        self.hydra.feed_activity(kind, intensity)
+        self.hydra.feed_activity(kind, _ACTIVITY_INTENSITY.get(kind, 0.3))
 
         # Ensure address is captured in address book
         if nkn_addr:
@@ -4076,17 +4228,9 @@ class EnhancedUI:
             addr = nkn_addr if nkn_addr else self._extract_nkn_addr(msg)
             self.stats.record_request(service, addr, bytes_out=bytes_sent, bytes_in=bytes_in, duration_s=duration_s)
         elif kind in ("IN", "OUT"):
-            # Extract service from message if provided (best-effort)
-            for svc in self.services.keys():
-                if svc in msg or svc in str(node_id):
-                    addr = nkn_addr if nkn_addr else self._extract_nkn_addr(msg)
-                    self.stats.record_request(svc, addr, bytes_out=bytes_sent, bytes_in=bytes_in, duration_s=duration_s)
-                    break
+            self._record_matched_service(node_id, msg, nkn_addr, bytes_sent, bytes_in, duration_s)
 
-        if self.enabled:
-            self.events.put((node_id, kind, msg, ts))
-        else:
-            print(f"[{ts}] {source:<8} {kind:<3} {msg}")
+        self._emit_activity(node_id, kind, msg, ts, source)
 
     def record_flow(
         self,
@@ -4099,8 +4243,80 @@ class EnhancedUI:
         blocked: bool = False,
     ) -> None:
         """Record a directional flow between a source and target for the Debug view."""
+        self._append_flow(time.strftime("%H:%M:%S"), source, target, payload, direction, service, channel, blocked)
+        if channel:
+            self.stats.touch_address(channel, service)
+        # Nudge hydra based on flow density
+        self.hydra.feed_activity("IN", 0.5 if direction == "→" else 0.4)
+
+    def observe(
+        self,
+        node_id: str,
+        kind: Optional[str] = None,
+        msg: str = "",
+        flow: Optional[Tuple[str, str, str]] = None,
+        direction: str = "→",
+        service: Optional[str] = None,
+        channel: Optional[str] = None,
+        blocked: bool = False,
+        usage: Optional[Tuple[int, int, float]] = None,
+        nkn_addr: str = "",
+        bytes_sent: int = 0,
+    ) -> None:
+        """Apply one relay message to the counters, flow log and usage stats together.
+
+        Equivalent to ``bump`` + ``record_flow`` + ``stats.record_request`` for the
+        same message, but the timestamp is formatted once, hydra is fed once and the
+        stats lock is taken once. ``flow`` is ``(source, target, payload)`` and
+        ``usage`` is ``(bytes_in, bytes_out, duration_s)`` for completed requests;
+        ``nkn_addr`` and ``bytes_sent`` are passed on exactly as ``bump`` takes them.
+        """
         ts = time.strftime("%H:%M:%S")
-        entry = {
+        source = self._note_activity(node_id, kind, msg, ts) if kind else None
+        if flow is not None:
+            self._append_flow(ts, flow[0], flow[1], flow[2], direction, service, channel, blocked)
+        if kind:
+            self.hydra.feed_activity(kind, _ACTIVITY_INTENSITY.get(kind, 0.3))
+        elif flow is not None:
+            self.hydra.feed_activity("IN", 0.5 if direction == "→" else 0.4)
+
+        if usage is not None and service:
+            bytes_in, bytes_out, duration_s = usage
+            # record_request also refreshes the address book entry for the channel.
+            self.stats.record_request(
+                service, channel or "unknown", bytes_out=bytes_out, bytes_in=bytes_in, duration_s=duration_s
+            )
+        elif channel and flow is not None:
+            self.stats.touch_address(channel, service)
+        if kind in ("IN", "OUT"):
+            self._record_matched_service(node_id, msg, nkn_addr, bytes_sent, 0, 0.0)
+
+        if kind:
+            self._emit_activity(node_id, kind, msg, ts, source)
+
+    def _note_activity(self, node_id: str, kind: str, msg: str, ts: str) -> str:
+        target = self.nodes.get(node_id)
+        if target:
+            target["last"] = msg
+            if kind == "IN":
+                target["in"] += 1
+            elif kind == "OUT":
+                target["out"] += 1
+            elif kind == "ERR":
+                target["err"] += 1
+        source = (target.get("name") if target else node_id) or node_id
+        self.activity.append((ts, source, kind, msg))
+        return source
+
+    def _emit_activity(self, node_id: str, kind: str, msg: str, ts: str, source: str) -> None:
+        if self.enabled:
+            self.events.put((node_id, kind, msg, ts))
+        else:
+            print(f"[{ts}] {source:<8} {kind:<3} {msg}")
+
+    def _append_flow(self, ts: str, source: str, target: str, payload: str, direction: str,
+                     service: Optional[str], channel: Optional[str], blocked: bool) -> None:
+        self.flow_logs.append({
             "ts": ts,
             "source": source or "unknown",
             "target": target or "unknown",
@@ -4109,12 +4325,16 @@ class EnhancedUI:
             "service": service or "All",
             "channel": channel or "",
             "blocked": bool(blocked),
-        }
-        self.flow_logs.append(entry)
-        if channel:
-            self.stats.touch_address(channel, service)
-        # Nudge hydra based on flow density
-        self.hydra.feed_activity("IN", 0.5 if direction == "→" else 0.4)
+        })
+
+    def _record_matched_service(self, node_id: str, msg: str, nkn_addr: str, bytes_sent: int,
+                                bytes_in: int, duration_s: float) -> None:
+        # Extract service from message if provided (best-effort)
+        for svc in self.services.keys():
+            if svc in msg or svc in str(node_id):
+                addr = nkn_addr if nkn_addr else self._extract_nkn_addr(msg)
+                self.stats.record_request(svc, addr, bytes_out=bytes_sent, bytes_in=bytes_in, duration_s=duration_s)
+                break
 
     def _extract_nkn_addr(self, msg: str) -> str:
         """Extract NKN address from message string."""
@@ -6375,6 +6595,105 @@ class EnhancedUI:
 # ──────────────────────────────────────────────────────────────
 # Unified curses UI (Legacy - kept for backwards compatibility)
 # ──────────────────────────────────────────────────────────────
+QR_CACHE_MAX = 32
+UI_ACTIVITY_MAX = 500
+UI_SERVICE_ROW_CACHE_MAX = 64
+RELAY_IDENTIFIER_RE = re.compile(r"^(.*?-relay)(?:-[^.]+)?$")
+CONTENT_DISPOSITION_FILENAME_RE = re.compile(r"filename\*=UTF-8''([^;]+)|filename=\"?([^\";]+)\"?", re.I)
+LOG_TAIL_CHUNK = 8192
+LOG_TAIL_CHUNK_MAX = 64 * 1024
+# Upper bound on how far back a tail reads; logs full of \r progress bars can
+# go megabytes without a \n.
+LOG_TAIL_MAX_BYTES = 1024 * 1024
+# Port announcements services print on startup, in priority order per line.
+LOG_PORT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Running on .*:(\d+)",  # Flask: "Running on http://127.0.0.1:5000"
+        r"listening on .*:(\d+)",  # Generic: "listening on 0.0.0.0:8080"
+        r"Listening on port (\d+)",  # Generic: "Listening on port 8080"
+        r"Server.*port (\d+)",  # Generic: "Server started on port 8080"
+        r"Started.*:(\d+)",  # Generic: "Started on :8080"
+        r"http://[^:]+:(\d+)",  # URL pattern: "http://127.0.0.1:8080"
+    )
+)
+# Every LOG_PORT_PATTERNS match ends in one of these, so one search rules a line out.
+LOG_PORT_HINT_RE = re.compile(r":\d|port \d", re.IGNORECASE)
+
+
+def _tail_text(path: Path, n: int) -> str:
+    """Return the last n newline-terminated lines of a log as one string.
+
+    Reads start at LOG_TAIL_CHUNK and double up to LOG_TAIL_CHUNK_MAX, so a
+    short tail costs one small read and a 100-line tail rarely needs more
+    than two; at most LOG_TAIL_MAX_BYTES are read whatever the file size.
+    """
+    if n <= 0:
+        return ""
+    chunks: Deque[bytes] = deque()
+    fadvise = getattr(os, "posix_fadvise", None)
+    with open(path, "rb") as f:
+        fd = f.fileno()
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        if fadvise and end:
+            with contextlib.suppress(OSError):
+                fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                fadvise(fd, max(0, end - LOG_TAIL_CHUNK), 0, os.POSIX_FADV_WILLNEED)
+        newlines = 0
+        size = LOG_TAIL_CHUNK
+        while pos > 0 and newlines <= n and end - pos < LOG_TAIL_MAX_BYTES:
+            step = min(size, pos)
+            size = min(size * 2, LOG_TAIL_CHUNK_MAX)
+            pos -= step
+            if hasattr(os, "pread"):
+                chunk = os.pread(fd, step, pos)
+            else:
+                f.seek(pos)
+                chunk = f.read(step)
+            chunks.appendleft(chunk)
+            newlines += chunk.count(b"\n")
+        if fadvise:
+            with contextlib.suppress(OSError):
+                fadvise(fd, pos, end - pos, os.POSIX_FADV_DONTNEED)
+    data = b"".join(chunks)
+    cut = len(data.rstrip(b"\n"))
+    for _ in range(n):
+        cut = data.rfind(b"\n", 0, cut)
+        if cut < 0:
+            break
+    return data[cut + 1:].decode("utf-8", errors="replace")
+
+
+def _tail_lines(path: Path, n: int) -> List[str]:
+    """Return the last n lines of a log, reading backwards from EOF."""
+    return _tail_text(path, n).splitlines()[-n:]
+
+
+def _port_from_log_text(text: str) -> Optional[int]:
+    """Most recently announced service port in a log tail, or None.
+
+    One LOG_PORT_HINT_RE sweep over the whole tail finds the candidate lines;
+    only those are cut out (at \\n or \\r, so progress-bar redraws count as
+    lines) and tried against LOG_PORT_PATTERNS, newest line first.
+    """
+    hits = [m.start() for m in LOG_PORT_HINT_RE.finditer(text)]
+    line_start = len(text) + 1
+    for pos in reversed(hits):
+        if pos >= line_start:
+            continue  # another hit on a line already checked
+        line_start = max(text.rfind("\n", 0, pos), text.rfind("\r", 0, pos)) + 1
+        ends = [i for i in (text.find("\n", pos), text.find("\r", pos)) if i >= 0]
+        line = text[line_start:min(ends) if ends else len(text)]
+        for pattern in LOG_PORT_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                port = int(match.group(1))
+                if 1024 <= port <= 65535:
+                    return port
+    return None
+
+
 class UnifiedUI:
     def __init__(self, enabled: bool):
         self.enabled = enabled and curses is not None and sys.stdout.isatty()
@@ -6397,8 +6716,17 @@ class UnifiedUI:
         self.qr_locked: bool = False
         self.qr_row_ref: Optional[dict] = None
         self._last_dims: Tuple[int, int] = (0, 0)
-        self.activity: Deque[Tuple[str, str, str, str]] = deque(maxlen=500)
+        self.activity: Deque[Tuple[str, str, str, str, str]] = deque(maxlen=UI_ACTIVITY_MAX)
         self.chunk_upload_kb: int = 600
+        self._screen_cache: List[Optional[Tuple[str, int]]] = []
+        self._dirty = threading.Event()
+        self._qr_cache: "OrderedDict[Tuple[str, int], List[str]]" = OrderedDict()
+        self._qr_addr_seen: Dict[str, str] = {}
+        # Addresses whose QR art is stale; queued by set_addr (bridge thread)
+        # and dropped from _qr_cache on the UI thread.
+        self._qr_stale: Deque[str] = deque()
+        self._popup_win = None
+        self._service_row_cache: Dict[Tuple[str, str], dict] = {}
 
     def add_node(self, node_id: str, name: str):
         self.nodes.setdefault(node_id, {
@@ -6425,22 +6753,30 @@ class UnifiedUI:
 
     def set_addr(self, node_id: str, addr: Optional[str]):
         if node_id in self.nodes:
+            self._forget_qr(node_id, addr or "")
+            self._service_row_cache.clear()
             self.nodes[node_id]["addr"] = addr or "—"
             self.nodes[node_id]["state"] = "online" if addr else "waiting"
+            self._dirty.set()
 
     def set_state(self, node_id: str, state: str):
         if node_id in self.nodes:
             self.nodes[node_id]["state"] = state
+            self._dirty.set()
 
     def set_queue(self, node_id: str, size: int):
         if node_id in self.nodes:
             self.nodes[node_id]["queue"] = max(0, size)
+            self._dirty.set()
 
     def set_node_services(self, node_id: str, services: List[str]):
         if node_id in self.nodes:
             self.nodes[node_id]["services"] = services
+            self._dirty.set()
 
     def update_service_info(self, name: str, info: dict):
+        if "assigned_addr" in info:
+            self._forget_qr(name, info.get("assigned_addr") or "")
         cur = self.services.get(name, {})
         cur.update(info)
         self.services[name] = cur
@@ -6449,9 +6785,11 @@ class UnifiedUI:
             self.service_index %= len(self.service_names)
         else:
             self.service_index = 0
+        self._dirty.set()
 
     def set_daemon_info(self, info: Optional[dict]):
         self.daemon_info = info
+        self._dirty.set()
 
     def bump(self, node_id: str, kind: str, msg: str):
         target = self.nodes.get(node_id)
@@ -6464,8 +6802,9 @@ class UnifiedUI:
             elif kind == "ERR":
                 target["err"] += 1
         ts = time.strftime("%H:%M:%S")
-        source = target.get("name") if target else node_id
-        self.activity.append((ts, source or node_id, kind, msg))
+        source = (target.get("name") if target else node_id) or node_id
+        self.activity.append((ts, source, kind, msg, f"[{ts}] {source} {kind}: {msg}"))
+        self._dirty.set()
         if self.enabled:
             self.events.put((node_id, kind, msg, ts))
         else:
@@ -6490,7 +6829,7 @@ class UnifiedUI:
     def _main(self, stdscr):
         curses.curs_set(0)
         stdscr.nodelay(True)
-        stdscr.timeout(120)
+        stdscr.timeout(200)
         color_enabled = False
         header_attr = curses.A_BOLD
         node_attr = curses.A_NORMAL
@@ -6505,6 +6844,9 @@ class UnifiedUI:
             node_attr = curses.color_pair(2)
             section_attr = curses.color_pair(3) | curses.A_BOLD
             color_enabled = True
+        ch = -1
+        selected_row: Optional[dict] = None
+        self._dirty.set()
         while not self.stop.is_set():
             try:
                 while True:
@@ -6512,108 +6854,94 @@ class UnifiedUI:
             except queue.Empty:
                 pass
 
-            stdscr.erase()
-            stdscr.addnstr(0, 0, "Unified NKN Router — arrows: cycle services, e: pin QR, s: activity, c: config, q: quit", max(0, curses.COLS - 1), header_attr)
-            if self.daemon_info:
-                daemon_line = f"Daemon: enabled at {self.daemon_info.get('path','?')}"
-            else:
-                daemon_line = "Daemon: disabled"
-            stdscr.addnstr(1, 0, daemon_line[: curses.COLS - 1], curses.A_DIM)
-
-            rows = self._build_rows()
-            self._interactive_rows = [row for row in rows if row.get("selectable")]
-            selected_row = self._interactive_rows[0] if self._interactive_rows else None
-
-            now = time.time()
-            qr_candidates = [] if self.show_activity else [row for row in rows if row.get("type") in ("node", "service")]
-            if not self.show_activity:
-                if qr_candidates:
-                    if qr_candidates != self.qr_candidates:
-                        self.qr_candidates = qr_candidates
-                        self.qr_cycle_index = self.qr_cycle_index % len(self.qr_candidates)
-                    if not self.qr_locked and (now >= self.qr_next_ts or not self.qr_cycle_lines):
-                        self._advance_qr_cycle()
+            if self._dirty.is_set() or ch != -1 or self._qr_due(time.monotonic()):
+                self._dirty.clear()
+                lines_total, cols_total = curses.LINES, curses.COLS
+                max_rows = lines_total - 1
+                width = max(0, cols_total - 1)
+                frame: List[Tuple[str, int]] = []
+                header = "Unified NKN Router — arrows: cycle services, e: pin QR, s: activity, c: config, q: quit"
+                frame.append((header[:width], header_attr))
+                if self.daemon_info:
+                    daemon_line = f"Daemon: enabled at {self.daemon_info.get('path','?')}"
                 else:
-                    self.qr_candidates = []
-                    if not self.qr_locked:
-                        self.qr_cycle_lines = []
-
-                dims = (curses.LINES, curses.COLS)
-                if self.qr_row_ref and dims != self._last_dims:
-                    label, lines = self._qr_text_for_row(self.qr_row_ref, include_detail=False)
-                    self._set_cycle_display(label, lines, lock=self.qr_locked, remember_row=self.qr_row_ref)
-                self._last_dims = dims
-
-            screen_row = 3
-            width = max(0, curses.COLS - 1)
-            if self.show_activity:
-                # Full-screen activity log, no QR
-                for row in rows:
-                    if row.get("type") == "activity_header":
-                        try:
-                            stdscr.addnstr(screen_row, 0, row.get("text", "")[:width], node_attr | curses.A_BOLD)
-                        except curses.error:
-                            pass
-                        screen_row += 1
-                        continue
-                    if row.get("type") != "activity":
-                        continue
-                    if screen_row >= curses.LINES - 1:
-                        break
-                    try:
-                        stdscr.addnstr(screen_row, 0, row.get("text", "")[:width], node_attr)
-                    except curses.error:
-                        pass
-                    screen_row += 1
-            else:
-                for row in rows:
-                    if screen_row >= curses.LINES - 1:
-                        break
-                    rtype = row.get("type")
-                    if rtype == "separator":
-                        screen_row += 1
-                        continue
-                    attr = node_attr if rtype in ("node", "service") else curses.A_NORMAL
-                    if rtype == "header":
-                        attr = header_attr
-                    if rtype == "section":
-                        attr = section_attr
-                    if rtype in ("activity", "activity_header"):
-                        attr = node_attr
-                        if rtype == "activity_header":
-                            attr |= curses.A_BOLD
-                    prefix = ""
-                    if row.get("selectable"):
-                        prefix = "• " if (selected_row and row is selected_row) else "  "
-                    text = prefix + row.get("text", "")
-                    if selected_row and row is selected_row and row.get("selectable"):
-                        attr |= curses.A_REVERSE
-                    try:
-                        stdscr.addnstr(screen_row, 0, text[:width], attr)
-                    except curses.error:
-                        pass
-                    screen_row += 1
-
-            if self.qr_cycle_lines and not self.show_activity:
-                mode = "locked" if self.qr_locked else "auto"
-                label_line = f"QR ({mode} every 10s): {self.qr_cycle_label}" if self.qr_cycle_label else f"QR ({mode})"
-                if screen_row < curses.LINES - 1:
-                    try:
-                        stdscr.addnstr(screen_row, 0, label_line[:width], curses.A_DIM | curses.A_BOLD)
-                    except curses.error:
-                        pass
-                    screen_row += 1
-                for ln in self.qr_cycle_lines:
-                    if screen_row >= curses.LINES - 1:
-                        break
-                    try:
-                        stdscr.addnstr(screen_row, 0, ln[:width], curses.A_DIM)
-                    except curses.error:
-                        pass
-                    screen_row += 1
+                    daemon_line = "Daemon: disabled"
+                frame.append((daemon_line[:width], curses.A_DIM))
+                frame.append(("", curses.A_NORMAL))
+
+                rows = self._build_rows(limit=max_rows)
+                self._interactive_rows = [row for row in rows if row.get("selectable")]
+                selected_row = self._interactive_rows[0] if self._interactive_rows else None
+
+                now = time.monotonic()
+                qr_candidates = [] if self.show_activity else [row for row in rows if row.get("type") in ("node", "service")]
+                if not self.show_activity:
+                    if qr_candidates:
+                        if qr_candidates != self.qr_candidates:
+                            self.qr_candidates = qr_candidates
+                            self.qr_cycle_index = self.qr_cycle_index % len(self.qr_candidates)
+                        if not self.qr_locked and (now >= self.qr_next_ts or not self.qr_cycle_lines):
+                            self._advance_qr_cycle()
+                    else:
+                        self.qr_candidates = []
+                        if not self.qr_locked:
+                            self.qr_cycle_lines = []
+
+                    dims = (lines_total, cols_total)
+                    if self.qr_row_ref and dims != self._last_dims:
+                        label, lines = self._qr_text_for_row(self.qr_row_ref, include_detail=False)
+                        self._set_cycle_display(label, lines, lock=self.qr_locked, remember_row=self.qr_row_ref)
+                    self._last_dims = dims
+
+                if self.show_activity:
+                    # Full-screen activity log, no QR
+                    for row in rows:
+                        if row.get("type") == "activity_header":
+                            frame.append((row.get("text", "")[:width], node_attr | curses.A_BOLD))
+                            continue
+                        if row.get("type") != "activity":
+                            continue
+                        if len(frame) >= max_rows:
+                            break
+                        frame.append((row.get("text", "")[:width], node_attr))
+                else:
+                    for row in rows:
+                        if len(frame) >= max_rows:
+                            break
+                        rtype = row.get("type")
+                        if rtype == "separator":
+                            frame.append(("", curses.A_NORMAL))
+                            continue
+                        attr = node_attr if rtype in ("node", "service") else curses.A_NORMAL
+                        if rtype == "header":
+                            attr = header_attr
+                        if rtype == "section":
+                            attr = section_attr
+                        if rtype in ("activity", "activity_header"):
+                            attr = node_attr
+                            if rtype == "activity_header":
+                                attr |= curses.A_BOLD
+                        prefix = ""
+                        if row.get("selectable"):
+                            prefix = "• " if (selected_row and row is selected_row) else "  "
+                        text = prefix + row.get("text", "")
+                        if selected_row and row is selected_row and row.get("selectable"):
+                            attr |= curses.A_REVERSE
+                        frame.append((text[:width], attr))
+
+                if self.qr_cycle_lines and not self.show_activity:
+                    mode = "locked" if self.qr_locked else "auto"
+                    label_line = f"QR ({mode} every 10s): {self.qr_cycle_label}" if self.qr_cycle_label else f"QR ({mode})"
+                    if len(frame) < max_rows:
+                        frame.append((label_line[:width], curses.A_DIM | curses.A_BOLD))
+                    for ln in self.qr_cycle_lines:
+                        if len(frame) >= max_rows:
+                            break
+                        frame.append((ln[:width], curses.A_DIM))
 
-            stdscr.refresh()
+                self._paint_frame(stdscr, frame)
 
+            stdscr.timeout(self._poll_timeout_ms(time.monotonic()))
             try:
                 ch = stdscr.getch()
                 if ch in (ord('q'), ord('Q')):
@@ -6629,34 +6957,75 @@ class UnifiedUI:
                 elif ch in (curses.KEY_ENTER, 10, 13):
                     if selected_row:
                         self._handle_enter(stdscr, selected_row)
+                        self._invalidate_frame(stdscr)
                 elif ch in (ord('s'), ord('S')):
                     self.show_activity = not self.show_activity
                 elif ch in (ord('c'), ord('C')):
                     self._handle_config_prompt(stdscr)
+                    self._invalidate_frame(stdscr)
+                elif ch == curses.KEY_RESIZE:
+                    curses.update_lines_cols()
+                    self._popup_win = None
+                    self._invalidate_frame(stdscr)
             except Exception:
                 pass
 
+    def _qr_due(self, now: float) -> bool:
+        return bool(self.qr_candidates) and not self.show_activity and not self.qr_locked and now >= self.qr_next_ts
+
+    def _poll_timeout_ms(self, now: float) -> int:
+        # Wake for the next QR rotation on time, but keep polling events at least every 200 ms.
+        if not self.qr_candidates or self.show_activity or self.qr_locked:
+            return 200
+        return int(min(200.0, max(50.0, (self.qr_next_ts - now) * 1000.0)))
+
+    def _paint_frame(self, stdscr, frame: List[Tuple[str, int]]) -> None:
+        """Repaint only the rows whose (text, attr) changed, then flush once."""
+        cache = self._screen_cache
+        if len(cache) != curses.LINES:
+            cache = self._screen_cache = [None] * curses.LINES
+        blank = ("", curses.A_NORMAL)
+        for screen_row in range(len(cache)):
+            cell = frame[screen_row] if screen_row < len(frame) else blank
+            if cache[screen_row] == cell:
+                continue
+            try:
+                stdscr.move(screen_row, 0)
+                stdscr.clrtoeol()
+                if cell[0]:
+                    stdscr.addnstr(screen_row, 0, cell[0], len(cell[0]), cell[1])
+            except curses.error:
+                pass
+            cache[screen_row] = cell
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+    def _invalidate_frame(self, stdscr) -> None:
+        # Popups and resizes leave the physical screen out of sync with the row cache.
+        self._screen_cache = [None] * curses.LINES
+        stdscr.erase()
+
     def _cycle_service(self, delta: int) -> None:
         if not self.service_names:
             return
         self.service_index = (self.service_index + delta) % len(self.service_names)
         self.qr_locked = False
         self._advance_qr_cycle(force_row=True)
+        self._dirty.set()
 
     def _handle_config_prompt(self, stdscr) -> None:
         kb = self._prompt_number(stdscr, "Chunk upload size (KB)", self.chunk_upload_kb or 600)
         if kb is not None and self.action_handler:
             self.action_handler({"type": "config", "key": "chunk_upload_kb", "value": kb})
 
-    def _build_rows(self) -> List[dict]:
+    def _build_rows(self, limit: Optional[int] = None) -> List[dict]:
         rows: List[dict] = []
         if self.show_activity:
             rows.append({"type": "activity_header", "text": "Service Activity (s to toggle, ↑/↓ to scroll)", "selectable": False})
             if self.activity:
-                # Show most recent first; allow the list to fill the screen
-                for ts, source, kind, message in reversed(self.activity):
-                    line = f"[{ts}] {source} {kind}: {message}"
-                    rows.append({"type": "activity", "text": line, "selectable": False})
+                # Show most recent first; only as many entries as fit on screen
+                for entry in itertools.islice(reversed(self.activity), limit):
+                    rows.append({"type": "activity", "text": entry[4], "selectable": False})
             else:
                 rows.append({"type": "activity", "text": "(no recent activity)", "selectable": False})
             return rows
@@ -6666,22 +7035,32 @@ class UnifiedUI:
             name = self.service_names[self.service_index % len(self.service_names)]
             info = self.services.get(name, {})
             addr = info.get("assigned_addr") or "—"
-            rows.append({"type": "service", "id": name, "text": f"{name} {addr}", "selectable": True})
+            key = (name, addr)
+            row = self._service_row_cache.get(key)
+            if row is None:
+                if len(self._service_row_cache) >= UI_SERVICE_ROW_CACHE_MAX:
+                    self._service_row_cache.clear()
+                row = {"type": "service", "id": name, "text": f"{name} {addr}", "selectable": True}
+                self._service_row_cache[key] = row
+            rows.append(row)
         else:
             rows.append({"type": "service", "id": "none", "text": "(no services yet)", "selectable": False})
         return rows
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _extract_identifier_segment(value: str) -> str:
         if not value:
             return ""
         segment = value.strip()
-        if "relay-" in segment:
-            segment = segment.split("relay-")[-1]
-        for sep in (":", "@"):
-            if sep in segment:
-                segment = segment.split(sep)[-1]
-        return segment
+        # Keep whatever follows the last "relay-", ":" or "@", in one slice.
+        relay_at = segment.rfind("relay-")
+        cut = max(
+            relay_at + 6 if relay_at >= 0 else 0,
+            segment.rfind(":") + 1,
+            segment.rfind("@") + 1,
+        )
+        return segment[cut:]
 
     def _service_identifier(self, addr: str, assigned: str) -> str:
         for candidate in (addr, assigned):
@@ -6722,7 +7101,7 @@ class UnifiedUI:
             log_path = Path(path)
             if not log_path.exists():
                 raise FileNotFoundError(path)
-            lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()[-20:]
+            lines = _tail_lines(log_path, 20)
             text = "\n".join(lines) if lines else "(log empty)"
             self._show_message(stdscr, text)
         except Exception as exc:
@@ -6742,7 +7121,7 @@ class UnifiedUI:
                 log_path = Path(path)
                 if not log_path.exists():
                     raise FileNotFoundError(path)
-                lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()[-10:]
+                lines = _tail_lines(log_path, 10)
                 output_lines.append(f"[{svc}] {path}")
                 output_lines.extend(lines if lines else ["(log empty)"])
             except Exception as exc:
@@ -6795,19 +7174,41 @@ class UnifiedUI:
             lines.append("")
 
         if addr:
-            ascii_lines = render_qr_ascii(addr).splitlines()
-            ascii_lines = [ln[:max_width] for ln in ascii_lines]
-            lines.extend(ascii_lines)
+            lines.extend(self._qr_ascii_lines(addr, max_width))
         else:
             lines.append("(No NKN address yet)")
         return (label, lines)
 
+    def _qr_ascii_lines(self, addr: str, max_width: int) -> List[str]:
+        while self._qr_stale:
+            prev = self._qr_stale.popleft()
+            for stale_key in [k for k in self._qr_cache if k[0] == prev]:
+                self._qr_cache.pop(stale_key, None)
+        key = (addr, max_width)
+        cached = self._qr_cache.get(key)
+        if cached is not None:
+            self._qr_cache.move_to_end(key)
+            return cached
+        ascii_lines = [ln[:max_width] for ln in render_qr_ascii(addr).splitlines()]
+        self._qr_cache[key] = ascii_lines
+        while len(self._qr_cache) > QR_CACHE_MAX:
+            self._qr_cache.popitem(last=False)
+        return ascii_lines
+
+    def _forget_qr(self, row_id: str, addr: str) -> None:
+        prev = self._qr_addr_seen.get(row_id)
+        if prev == addr:
+            return
+        self._qr_addr_seen[row_id] = addr
+        if prev:
+            self._qr_stale.append(prev)
+
     def _set_cycle_display(self, label: str, lines: List[str], delay: float = 10.0, lock: bool = False, remember_row: Optional[dict] = None) -> None:
         if not lines:
             lines = ["(No data)"]
         self.qr_cycle_label = label
         self.qr_cycle_lines = lines
-        self.qr_next_ts = time.time() + delay
+        self.qr_next_ts = time.monotonic() + delay
         if remember_row is not None:
             self.qr_row_ref = remember_row
         if lock:
@@ -6821,15 +7222,10 @@ class UnifiedUI:
         return f"{base}.{addr_hex}" if addr_hex else base
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _clean_identifier(name: str) -> str:
-        try:
-            import re
-            m = re.match(r"^(.*?-relay)(?:-[^.]+)?$", name)
-            if m:
-                return m.group(1)
-        except Exception:
-            pass
-        return name
+        m = RELAY_IDENTIFIER_RE.match(name)
+        return m.group(1) if m else name
 
     def _advance_qr_cycle(self, force_row: bool = False) -> None:
         if not self.qr_candidates:
@@ -6842,6 +7238,7 @@ class UnifiedUI:
             self.qr_cycle_index = (self.qr_cycle_index + 1) % max(1, len(self.qr_candidates))
         label, lines = self._qr_text_for_row(row, include_detail=False)
         self._set_cycle_display(label, lines, remember_row=row)
+        self._dirty.set()
 
     def _show_qr_for_row(self, stdscr, row: dict, include_detail: bool = False) -> None:
         if not row:
@@ -6851,6 +7248,23 @@ class UnifiedUI:
         if include_detail and lines_detail:
             self._show_message(stdscr, "\n".join(lines_detail))
         self._set_cycle_display(label_inline, lines_inline)
+
+    def _get_popup(self, height: int, width: int, y: int, x: int):
+        """Return the shared popup window, reshaped and cleared for this dialog."""
+        win = self._popup_win
+        if win is not None:
+            try:
+                win.resize(height, width)
+                win.mvwin(y, x)
+            except curses.error:
+                win = None
+        if win is None:
+            win = curses.newwin(height, width, y, x)
+            self._popup_win = win
+        win.erase()
+        win.box()
+        return win
+
     def _prompt_menu(self, stdscr, title: str, options: List[str]) -> Optional[int]:
         if not options:
             return None
@@ -6858,24 +7272,24 @@ class UnifiedUI:
         width = max(len(title), *(len(opt) for opt in options)) + 6
         y = max(2, (curses.LINES - height) // 2)
         x = max(2, (curses.COLS - width) // 2)
-        win = curses.newwin(height, width, y, x)
-        win.box()
+        win = self._get_popup(height, width, y, x)
         win.addnstr(1, 2, title, width - 4, curses.A_BOLD)
         idx = 0
         while True:
             for i, opt in enumerate(options):
                 attr = curses.A_REVERSE if i == idx else curses.A_NORMAL
                 win.addnstr(3 + i, 2, opt[: width - 4], attr)
-            win.refresh()
+            win.noutrefresh()
+            curses.doupdate()
             ch = win.getch()
             if ch in (curses.KEY_UP, ord('k')):
                 idx = (idx - 1) % len(options)
             elif ch in (curses.KEY_DOWN, ord('j')):
                 idx = (idx + 1) % len(options)
             elif ch in (curses.KEY_ENTER, 10, 13):
-                win.clear(); win.refresh(); return idx
+                win.clear(); win.noutrefresh(); curses.doupdate(); return idx
             elif ch in (27, ord('q')):
-                win.clear(); win.refresh(); return None
+                win.clear(); win.noutrefresh(); curses.doupdate(); return None
 
     def _show_message(self, stdscr, message: str) -> None:
         lines = message.splitlines() or [message]
@@ -6883,18 +7297,19 @@ class UnifiedUI:
         width = min(max(len(line) for line in lines) + 4, curses.COLS - 2)
         y = max(1, (curses.LINES - height) // 2)
         x = max(1, (curses.COLS - width) // 2)
-        win = curses.newwin(height, width, y, x)
-        win.box()
+        win = self._get_popup(height, width, y, x)
         for i, line in enumerate(lines[: height - 4]):
             win.addnstr(2 + i, 2, line[: width - 4], curses.A_NORMAL)
         win.addnstr(height - 2, 2, "Press Enter", curses.A_DIM)
-        win.refresh()
+        win.noutrefresh()
+        curses.doupdate()
         while True:
             ch = win.getch()
             if ch in (curses.KEY_ENTER, 10, 13, 27, ord('q')):
                 break
         win.clear()
-        win.refresh()
+        win.noutrefresh()
+        curses.doupdate()
 
     def _prompt_number(self, stdscr, title: str, default_val: int) -> Optional[int]:
         prompt = f"{title} (current: {default_val}): "
@@ -6902,8 +7317,7 @@ class UnifiedUI:
         height = 5
         y = max(1, (curses.LINES - height) // 2)
         x = max(1, (curses.COLS - width) // 2)
-        win = curses.newwin(height, width, y, x)
-        win.box()
+        win = self._get_popup(height, width, y, x)
         win.addnstr(1, 2, prompt[: width - 4], curses.A_BOLD)
         curses.echo()
         try:
@@ -6917,7 +7331,8 @@ class UnifiedUI:
         finally:
             curses.noecho()
             win.clear()
-            win.refresh()
+            win.noutrefresh()
+            curses.doupdate()
 
 
 # ──────────────────────────────────────────────────────────────
@@ -6928,6 +7343,12 @@ DM_OPTS_SINGLE = {"noReply": True}
 BRIDGE_MIN_S = 0.5
 BRIDGE_MAX_S = 30.0
 SEND_QUEUE_MAX = 2000
+SEND_BATCH_MAX = 64
+SEND_BATCH_BYTES = 262144
+BRIDGE_READ_BYTES = 65536
+# The sidecar emits compact JSON.stringify output, so self-probe echoes
+# always carry this exact byte sequence and can be dropped undecoded.
+BRIDGE_SELFPROBE_MARK = b'"msg":{"event":"relay.selfprobe"'
 
 
 class BridgeManager:
@@ -6937,15 +7358,17 @@ class BridgeManager:
         self.ui = ui
         self.on_dm = on_dm
         self.on_ready = on_ready
-        self.proc: Optional[subprocess.Popen[str]] = None
+        self.proc: Optional[subprocess.Popen[bytes]] = None
         self.lock = threading.Lock()
         self.stop = threading.Event()
         self.addr = ""
         self.backoff = BRIDGE_MIN_S
-        self.stdout_thread: Optional[threading.Thread] = None
+        self.pump_thread: Optional[threading.Thread] = None
         self.stderr_thread: Optional[threading.Thread] = None
         self.sender_thread: Optional[threading.Thread] = None
-        self.send_q: "queue.Queue[tuple[str, dict, dict]]" = queue.Queue(maxsize=SEND_QUEUE_MAX)
+        # deque append/popleft are atomic; the event only wakes an idle sender.
+        self.send_dq: Deque[bytes] = deque(maxlen=SEND_QUEUE_MAX)
+        self.send_ev = threading.Event()
 
     def start(self):
         with self.lock:
@@ -6959,8 +7382,6 @@ class BridgeManager:
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
                 )
                 self.addr = ""
                 self.backoff = BRIDGE_MIN_S
@@ -6969,23 +7390,38 @@ class BridgeManager:
             except Exception as e:  # pragma: no cover
                 self.ui.bump(self.node_id, "ERR", f"bridge spawn failed: {e}")
                 return
-        self.stdout_thread = threading.Thread(target=self._stdout_pump, daemon=True)
-        self.stdout_thread.start()
-        self.stderr_thread = threading.Thread(target=self._stderr_pump, daemon=True)
-        self.stderr_thread.start()
+        if os.name == "nt":
+            # selectors cannot watch pipes on Windows; fall back to one blocking reader per pipe.
+            self.pump_thread = threading.Thread(target=self._stdout_pump, daemon=True)
+            self.stderr_thread = threading.Thread(target=self._stderr_pump, daemon=True)
+            self.stderr_thread.start()
+        else:
+            self.pump_thread = threading.Thread(target=self._pipe_pump, daemon=True)
+        self.pump_thread.start()
         if not self.sender_thread:
             self.sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
             self.sender_thread.start()
 
     def dm(self, to: str, data: dict, opts: Optional[dict] = None):
-        payload = (to, data, opts or {})
-        try:
-            self.send_q.put_nowait(payload)
-        except queue.Full:
-            with contextlib.suppress(Exception):
-                _ = self.send_q.get_nowait()
-            with contextlib.suppress(Exception):
-                self.send_q.put_nowait(payload)
+        payload = {"type": "dm", "to": to, "data": data}
+        if opts:
+            payload["opts"] = opts
+        self._push_line(_json_dumps_bytes(payload) + b"\n")
+
+    def dm_encoded(self, to: str, data: bytes, opts: Optional[dict] = None):
+        """Send a DM whose ``data`` object is already JSON-encoded."""
+        line = b'{"type":"dm","to":' + _json_dumps_bytes(to) + b',"data":' + data
+        if opts:
+            line += b',"opts":' + _json_dumps_bytes(opts)
+        self._push_line(line + b"}\n")
+
+    def _push_line(self, line: bytes) -> None:
+        # A full deque evicts its oldest line, same as the old drop-one-and-retry.
+        self.send_dq.append(line)
+        # Only the first DM of a burst pays for the Event's lock/notify; the
+        # rest ride along in the sender's next batched write.
+        if not self.send_ev.is_set():
+            self.send_ev.set()
 
     def shutdown(self):
         self.stop.set()
@@ -7001,62 +7437,133 @@ class BridgeManager:
             self.on_ready(None)
 
     # internal --------------------------------------------------
+    @staticmethod
+    def _split_lines(buf: bytearray, chunk: bytes) -> List[bytes]:
+        """Append chunk to buf and pop every complete line out of it."""
+        buf += chunk
+        lines: List[bytes] = []
+        start = 0
+        while True:
+            idx = buf.find(b"\n", start)
+            if idx < 0:
+                break
+            lines.append(bytes(buf[start:idx]))
+            start = idx + 1
+        if start:
+            del buf[:start]
+        return lines
+
+    def _wait_exit(self, p: subprocess.Popen) -> None:
+        while p.poll() is None and not self.stop.wait(0.05):
+            pass
+
+    def _pipe_pump(self):
+        p = self.proc
+        if not p or not p.stdout or not p.stderr:
+            return
+        handlers = {p.stdout: self._on_stdout_line, p.stderr: self._on_stderr_line}
+        bufs = {p.stdout: bytearray(), p.stderr: bytearray()}
+        with selectors.DefaultSelector() as sel:
+            for stream in handlers:
+                sel.register(stream, selectors.EVENT_READ)
+            while sel.get_map() and not self.stop.is_set():
+                for key, _ in sel.select(timeout=0.5):
+                    stream = key.fileobj
+                    try:
+                        chunk = os.read(key.fd, BRIDGE_READ_BYTES)
+                    except OSError:
+                        chunk = b""
+                    if not chunk:
+                        sel.unregister(stream)
+                        tail = bufs[stream]
+                        if tail.strip():
+                            handlers[stream](bytes(tail))
+                        continue
+                    for raw in self._split_lines(bufs[stream], chunk):
+                        handlers[stream](raw)
+        self._wait_exit(p)
+        self._restart_later()
+
+    def _iter_lines(self, p: subprocess.Popen, stream: IO[bytes]):
+        """Yield complete lines from a bridge pipe using large block reads."""
+        fd = stream.fileno()
+        buf = bytearray()
+        while not self.stop.is_set():
+            try:
+                chunk = os.read(fd, BRIDGE_READ_BYTES)
+            except OSError:
+                break
+            if not chunk:
+                break
+            yield from self._split_lines(buf, chunk)
+        if buf.strip():
+            yield bytes(buf)
+        self._wait_exit(p)
+
     def _stdout_pump(self):
         p = self.proc
         if not p or not p.stdout:
             return
-        while not self.stop.is_set():
-            line = p.stdout.readline()
-            if not line:
-                if p.poll() is not None:
-                    break
-                time.sleep(0.05)
-                continue
-            try:
-                msg = json.loads(line.strip())
-            except Exception:
-                continue
-            typ = msg.get("type")
-            if typ == "ready":
-                self.addr = msg.get("address") or ""
-                self.ui.set_addr(self.node_id, self.addr)
-                self.ui.bump(self.node_id, "SYS", f"ready {self.addr}")
-                if self.on_ready:
-                    self.on_ready(self.addr)
-            elif typ == "status":
-                state = msg.get("state", "")
-                if state in ("probe_fail", "probe_exit", "error", "close"):
-                    self.ui.set_state(self.node_id, state)
-                self.ui.bump(self.node_id, "SYS", f"bridge {state}")
-            elif typ == "nkn-dm":
-                src = msg.get("src") or ""
-                body = msg.get("msg") or {}
-                if isinstance(body, dict) and body.get("event") == "relay.selfprobe":
-                    continue
-                self.on_dm(src, body)
-            elif typ == "err":
-                self.ui.bump(self.node_id, "ERR", msg.get("msg", "bridge error"))
+        for raw in self._iter_lines(p, p.stdout):
+            self._on_stdout_line(raw)
         self._restart_later()
 
     def _stderr_pump(self):
         p = self.proc
         if not p or not p.stderr:
             return
-        while not self.stop.is_set():
-            line = p.stderr.readline()
-            if not line:
-                if p.poll() is not None:
-                    break
-                time.sleep(0.05)
-                continue
-            self.ui.bump(self.node_id, "ERR", line.strip())
+        for raw in self._iter_lines(p, p.stderr):
+            self._on_stderr_line(raw)
+
+    def _on_stdout_line(self, raw: bytes) -> None:
+        if BRIDGE_SELFPROBE_MARK in raw and b'"type":"nkn-dm"' in raw:
+            return
+        try:
+            msg = _json_loads(raw)
+        except Exception:
+            return
+        if not isinstance(msg, dict):
+            return
+        typ = msg.get("type")
+        if typ == "ready":
+            self.addr = msg.get("address") or ""
+            self.ui.set_addr(self.node_id, self.addr)
+            self.ui.bump(self.node_id, "SYS", f"ready {self.addr}")
+            if self.on_ready:
+                self.on_ready(self.addr)
+        elif typ == "status":
+            state = msg.get("state", "")
+            if state in ("probe_fail", "probe_exit", "error", "close"):
+                self.ui.set_state(self.node_id, state)
+            self.ui.bump(self.node_id, "SYS", f"bridge {state}")
+        elif typ == "nkn-dm":
+            src = msg.get("src") or ""
+            body = msg.get("msg") or {}
+            if isinstance(body, dict) and body.get("event") == "relay.selfprobe":
+                return
+            self.on_dm(src, body)
+        elif typ == "err":
+            self.ui.bump(self.node_id, "ERR", msg.get("msg", "bridge error"))
+
+    def _on_stderr_line(self, raw: bytes) -> None:
+        line = raw.decode("utf-8", errors="replace").strip()
+        if line:
+            self.ui.bump(self.node_id, "ERR", line)
 
     def _sender_loop(self):
         while not self.stop.is_set():
-            try:
-                to, data, opts = self.send_q.get(timeout=0.2)
-            except queue.Empty:
+            self.send_ev.clear()
+            if not self.send_dq:
+                self.send_ev.wait(0.2)
                 continue
+            batch: List[bytes] = []
+            total = 0
+            with contextlib.suppress(IndexError):
+                while len(batch) < SEND_BATCH_MAX and total < SEND_BATCH_BYTES:
+                    item = self.send_dq.popleft()
+                    batch.append(item)
+                    total += len(item)
+            line = b"".join(batch)
             wrote = False
             while not wrote and not self.stop.is_set():
                 with self.lock:
@@ -7064,10 +7571,7 @@ class BridgeManager:
                     stdin = proc.stdin if proc else None
                 if proc and proc.poll() is None and stdin:
                     try:
-                        payload = {"type": "dm", "to": to, "data": data}
-                        if opts:
-                            payload["opts"] = opts
-                        stdin.write(json.dumps(payload) + "\n")
+                        stdin.write(line)
                         stdin.flush()
                         wrote = True
                         break
@@ -7075,7 +7579,9 @@ class BridgeManager:
                         time.sleep(0.1)
                 else:
                     time.sleep(0.2)
-            self.send_q.task_done()
+            if not wrote:
+                # Shutting down mid-batch: keep the unsent lines at the head.
+                self.send_dq.extendleft(reversed(batch))
 
     def _restart_later(self):
         if self.stop.is_set():
@@ -7180,30 +7686,6 @@ def _browser_opts(msg: dict) -> dict:
     return raw if isinstance(raw, dict) else {}
 
 
-def _browser_service(opts: dict) -> str:
-    return (opts.get("service") or "web_scrape").strip() or "web_scrape"
-
-
-def _browser_headers(opts: dict, base: Optional[dict] = None) -> dict:
-    headers = {}
-    if base:
-        headers.update(base)
-    extra = opts.get("headers")
-    if isinstance(extra, dict):
-        headers.update(extra)
-    return headers
-
-
-def _browser_timeout(opts: dict, default_ms: int) -> int:
-    raw = opts.get("timeout_ms")
-    if raw is None:
-        return default_ms
-    try:
-        return int(raw)
-    except Exception:
-        return default_ms
-
-
 def _browser_sid(msg: dict) -> str:
     sid = (msg.get("sid") or "").strip()
     if sid:
@@ -7219,23 +7701,70 @@ def _browser_path_with_sid(base_path: str, sid: str) -> str:
     return f"{base_path}?sid={urllib.parse.quote_plus(sid)}"
 
 
+@functools.lru_cache(maxsize=256)
+def _browser_request_template(key: tuple) -> dict:
+    service, path, method, headers, timeout_ms, stream, verify, insecure_tls = key
+    req = {
+        "service": service,
+        "path": path,
+        "method": method,
+        "headers": dict(headers),
+        "timeout_ms": timeout_ms,
+    }
+    if stream:
+        req["stream"] = stream
+    if verify is not None:
+        req["verify"] = verify
+    if insecure_tls:
+        req["insecure_tls"] = True
+    return req
+
+
 def _browser_request(msg: dict, path: str, *, method: str = "GET", json_body: Optional[dict] = None,
                      headers: Optional[dict] = None, stream: Optional[str] = None, default_timeout_ms: int = 45000) -> dict:
     opts = _browser_opts(msg)
+    service = (opts.get("service") or "web_scrape").strip() or "web_scrape"
+    merged_headers = dict(headers) if headers else {}
+    extra_headers = opts.get("headers")
+    if isinstance(extra_headers, dict):
+        merged_headers.update(extra_headers)
+    timeout_ms = default_timeout_ms
+    raw_timeout = opts.get("timeout_ms")
+    if raw_timeout is not None:
+        try:
+            timeout_ms = int(raw_timeout)
+        except Exception:
+            pass
+    verify = opts.get("verify")
+    if not isinstance(verify, bool):
+        verify = None
+    insecure_tls = opts.get("insecure_tls") in (True, "1", "true", "on")
+    if json_body is None:
+        # Body-less polls (dom/screenshot/events) repeat with identical options per
+        # session; reuse the built template and hand out a copy callers may mutate.
+        key = (service, path, method, tuple(merged_headers.items()), timeout_ms, stream, verify, insecure_tls)
+        try:
+            template = _browser_request_template(key)
+        except TypeError:  # unhashable header value
+            template = None
+        if template is not None:
+            req = dict(template)
+            req["headers"] = dict(template["headers"])
+            return req
     req = {
-        "service": _browser_service(opts),
+        "service": service,
         "path": path,
         "method": method,
-        "headers": _browser_headers(opts, headers or {}),
-        "timeout_ms": _browser_timeout(opts, default_timeout_ms),
+        "headers": merged_headers,
+        "timeout_ms": timeout_ms,
     }
     if json_body is not None:
         req["json"] = json_body
     if stream:
         req["stream"] = stream
-    if isinstance(opts.get("verify"), bool):
-        req["verify"] = bool(opts["verify"])
-    if opts.get("insecure_tls") in (True, "1", "true", "on"):
+    if verify is not None:
+        req["verify"] = verify
+    if insecure_tls:
         req["insecure_tls"] = True
     return req
 
@@ -7248,10 +7777,9 @@ def _with_sid_json(msg: dict, payload: dict) -> dict:
 
 
 def req_from_browser_open(msg: dict) -> dict:
-    opts = _browser_opts(msg)
     headless = msg.get("headless")
     if headless is None:
-        headless = opts.get("headless")
+        headless = _browser_opts(msg).get("headless")
     if headless is None:
         headless = True
     return _browser_request(
@@ -7259,7 +7787,7 @@ def req_from_browser_open(msg: dict) -> dict:
         "/session/start",
         method="POST",
         json_body={"headless": bool(headless)},
-        default_timeout_ms=_browser_timeout(opts, 60000),
+        default_timeout_ms=60000,
     )
 
 
@@ -7376,10 +7904,19 @@ def req_from_browser_scroll_down(msg: dict) -> dict:
     return _browser_request(msg, "/scroll/down", method="POST", json_body=payload)
 
 
+# Alias ladders are fixed, so spell them out once instead of re-deriving the
+# lower/replace variants on every DM.
+_DRAG_KEY_FALLBACKS = tuple(
+    (key, (key, key.lower(), key.replace("X", "x"), key.replace("Y", "y")))
+    for key in ("startX", "startY", "endX", "endY")
+)
+_SCROLL_POINT_KEYS = (("x", "X"), ("y", "Y"))
+
+
 def req_from_browser_drag(msg: dict) -> dict:
     payload = {}
-    for key in ("startX", "startY", "endX", "endY"):
-        value = msg.get(key) or msg.get(key.lower()) or msg.get(key.replace("X", "x")) or msg.get(key.replace("Y", "y"))
+    for key, (k0, k1, k2, k3) in _DRAG_KEY_FALLBACKS:
+        value = msg.get(k0) or msg.get(k1) or msg.get(k2) or msg.get(k3)
         if value is None:
             raise ValueError(f"browser.drag missing {key}")
         payload[key] = value
@@ -7393,10 +7930,10 @@ def req_from_browser_drag(msg: dict) -> dict:
 
 def req_from_browser_scroll_point(msg: dict) -> dict:
     payload = {}
-    for key in ("x", "y"):
-        if key not in msg and key.upper() not in msg:
+    for key, upper in _SCROLL_POINT_KEYS:
+        if key not in msg and upper not in msg:
             raise ValueError(f"browser.scroll_point missing {key}")
-        payload[key] = msg.get(key) or msg.get(key.upper())
+        payload[key] = msg.get(key) or msg.get(upper)
     payload["deltaX"] = msg.get("deltaX") or msg.get("delta_x") or 0
     payload["deltaY"] = msg.get("deltaY") or msg.get("delta_y") or 0
     payload["viewportW"] = msg.get("viewportW") or msg.get("viewport_w") or msg.get("width")
@@ -7407,18 +7944,135 @@ def req_from_browser_scroll_point(msg: dict) -> dict:
     return _browser_request(msg, "/scroll/point", method="POST", json_body=payload)
 
 
+# DM event -> (request builder, service the request is checked against).
+DM_REQUEST_BUILDERS: Dict[str, Tuple[Callable[[dict], dict], str]] = {
+    "asr.start": (req_from_asr_start, "whisper_asr"),
+    "asr.audio": (req_from_asr_audio, "whisper_asr"),
+    "asr.end": (req_from_asr_end, "whisper_asr"),
+    "asr.events": (req_from_asr_events, "whisper_asr"),
+    "browser.open": (req_from_browser_open, "web_scrape"),
+    "browser.close": (req_from_browser_close, "web_scrape"),
+    "browser.nav": (req_from_browser_nav, "web_scrape"),
+    "browser.click": (req_from_browser_click, "web_scrape"),
+    "browser.type": (req_from_browser_type, "web_scrape"),
+    "browser.scroll": (req_from_browser_scroll, "web_scrape"),
+    "browser.click_xy": (req_from_browser_click_xy, "web_scrape"),
+    "browser.dom": (req_from_browser_dom, "web_scrape"),
+    "browser.screenshot": (req_from_browser_screenshot, "web_scrape"),
+    "browser.events": (req_from_browser_events, "web_scrape"),
+    "browser.back": (req_from_browser_back, "web_scrape"),
+    "browser.forward": (req_from_browser_forward, "web_scrape"),
+    "browser.scroll_up": (req_from_browser_scroll_up, "web_scrape"),
+    "browser.scroll_down": (req_from_browser_scroll_down, "web_scrape"),
+    "browser.drag": (req_from_browser_drag, "web_scrape"),
+    "browser.scroll_point": (req_from_browser_scroll_point, "web_scrape"),
+}
+# Events handed to the Router instead of being relayed as HTTP.
+ROUTER_DM_EVENTS = frozenset({
+    "resolve_tunnels",
+    "resolve_tunnels_result",
+    "service_rpc_request",
+    "service_rpc_result",
+})
+
+
 # ──────────────────────────────────────────────────────────────
 # RelayNode combining bridge + HTTP workers
 # ──────────────────────────────────────────────────────────────
-class RelayNode:
-    def __init__(self, node_cfg: dict, global_cfg: dict, ui: UnifiedUI,
-                 assignment_lookup: Optional[Callable[[str], Tuple[Optional[str], Optional[str]]]],
-                 address_callback: Optional[Callable[[str, Optional[str]], None]],
-                 rate_limit_callback: Optional[Callable[[str, str], bool]] = None,
-                 router_event_handler: Optional[Callable[[str, str, dict, "RelayNode"], bool]] = None,
-                 nkn_traffic_callback: Optional[Callable[[str, str, dict, str], None]] = None,
-                 endpoint_usage_callback: Optional[Callable[[str, List[str]], None]] = None):
-        self.cfg = node_cfg
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+RESPONSE_CACHE_MAX = 128
+UPLOAD_SESSIONS_MAX = 256
+RESPONSE_CACHE_LINGER_S = 5.0
+UPLOAD_SPOOL_BYTES = 32 * 1024 * 1024
+UI_UPDATE_INTERVAL_S = 0.05
+PROBE_CACHE_OK_S = 15.0
+PROBE_CACHE_FAIL_S = 2.0
+
+
+class _DeferredRetry(Exception):
+    """Raised inside a worker to park the current job until its backoff elapses."""
+
+    def __init__(self, delay: float):
+        super().__init__(delay)
+        self.delay = delay
+
+
+class JobQueues:
+    """Per-worker job deques with work stealing.
+
+    Producers append to the deque picked by hashing the job key (so one
+    service always lands on the same worker and reuses that worker's
+    keep-alive session) and release a single permit. A woken worker drains
+    its own deque first, then steals the oldest job from its neighbours, so
+    a busy service still spreads across idle workers.
+
+    Jobs parked with ``put_later`` sit in a heap ordered by due time and are
+    handed out ahead of queued work once due.
+    """
+
+    def __init__(self, workers: int):
+        self.deques: List[Deque[Optional[dict]]] = [deque() for _ in range(max(1, workers))]
+        self.ready = threading.Semaphore(0)
+        self.delayed: List[Tuple[float, int, dict]] = []
+        self.delayed_lock = threading.Lock()
+        self._delayed_seq = itertools.count()
+
+    def put(self, item: Optional[dict], key: Any) -> None:
+        # CPython caches a str's hash on the object, so steering by key costs
+        # one SipHash per DM at most; a third-party hash (xxhash) would only
+        # add a C-call and an import for short service names / ~32 byte ids.
+        self.deques[hash(key) % len(self.deques)].append(item)
+        self.ready.release()
+
+    def put_later(self, item: dict, not_before: float) -> None:
+        """Park ``item`` until ``time.monotonic()`` reaches ``not_before``."""
+        with self.delayed_lock:
+            heapq.heappush(self.delayed, (not_before, next(self._delayed_seq), item))
+
+    def _pop_due(self) -> Tuple[Optional[dict], Optional[float]]:
+        """Return a due parked job, else (None, seconds until the next one is due)."""
+        if not self.delayed:
+            return None, None
+        with self.delayed_lock:
+            if not self.delayed:
+                return None, None
+            wait = self.delayed[0][0] - time.monotonic()
+            if wait <= 0:
+                return heapq.heappop(self.delayed)[2], None
+            return None, wait
+
+    def get(self, worker: int) -> Optional[dict]:
+        while True:
+            item, wait = self._pop_due()
+            if item is not None:
+                return item
+            if self.ready.acquire(timeout=wait):
+                break
+        n = len(self.deques)
+        while True:
+            for offset in range(n):
+                try:
+                    return self.deques[(worker + offset) % n].popleft()
+                except IndexError:
+                    continue
+            # Our permit guarantees a job exists; another worker took the one we saw.
+            time.sleep(0)
+
+    def qsize(self) -> int:
+        """Runnable (not parked) jobs."""
+        return sum(len(d) for d in self.deques)
+
+
+class RelayNode:
+    def __init__(self, node_cfg: dict, global_cfg: dict, ui: UnifiedUI,
+                 assignment_lookup: Optional[Callable[[str], Tuple[Optional[str], Optional[str]]]],
+                 address_callback: Optional[Callable[[str, Optional[str]], None]],
+                 rate_limit_callback: Optional[Callable[[str, str], bool]] = None,
+                 router_event_handler: Optional[Callable[[str, str, dict, "RelayNode"], bool]] = None,
+                 nkn_traffic_callback: Optional[Callable[[str, str, dict, str], None]] = None,
+                 endpoint_usage_callback: Optional[Callable[[str, List[str]], None]] = None):
+        self.cfg = node_cfg
         self.global_cfg = global_cfg
         self.ui = ui
         self.node_id = node_cfg.get("name") or node_cfg.get("id") or secrets.token_hex(4)
@@ -7447,7 +8101,14 @@ class RelayNode:
         self.retry_attempts = int(http_cfg.get("retries", 4))
         self.retry_backoff = float(http_cfg.get("retry_backoff", 0.5))
         self.retry_cap = float(http_cfg.get("retry_cap", 4.0))
-        self.jobs: "queue.Queue[dict]" = queue.Queue()
+        self.jobs = JobQueues(self.workers_count)
+        # Per-worker: the job whose first backend request may be deferred on failure.
+        self._retry_ctx = threading.local()
+        # UI update kind -> monotonic time the next one may be emitted (see _ui_due)
+        self._ui_next: Dict[str, float] = {}
+        # Set when a queue gauge update was rate-limited away; the upload
+        # cleanup sweep then pushes the current depth (trailing update).
+        self._queue_gauge_stale = False
         self.assignment_lookup = assignment_lookup or self._default_assignment_lookup
         self.address_callback = address_callback or (lambda _node, _addr: None)
         self.rate_limit_callback = rate_limit_callback
@@ -7478,21 +8139,38 @@ class RelayNode:
                 "scrape": "web_scrape",
             }
         self.alias_map = alias_map
+        # Exact-match view of the (already lowercase) keys with interned values,
+        # so the common case skips str()/lower() in _canonical_service.
+        self._alias_fast: Dict[str, str] = {
+            sys.intern(k): sys.intern(v) for k, v in alias_map.items() if k == k.lower()
+        }
         self.current_address: Optional[str] = None
         self.bridge = self._build_bridge()
         self.workers: list[threading.Thread] = []
+        # 429 bookkeeping, all on time.monotonic(); the deque bounds the trim loop.
         self.rate_limit_since: Optional[float] = None
         self.rate_limit_hits: Deque[float] = deque(maxlen=64)
         self.last_rate_limit: Optional[float] = None
-        self.upload_sessions: Dict[str, dict] = {}
-        self.response_cache: Dict[str, dict] = {}
+        # upload_id -> session, oldest first (see _open_upload_session)
+        self.upload_sessions: "OrderedDict[str, dict]" = OrderedDict()
+        # min-heap of (wall-clock time, upload_id) at which the cleanup loop should
+        # look at a session; pushed on each state change the loop acts on
+        self._upload_deadlines: List[Tuple[float, str]] = []
+        self._upload_deadlines_lock = threading.Lock()
+        # rid -> {"chunks": {seq: encoded relay.response.chunk bytes}, "created": ts,
+        #         "expires_at": monotonic deadline once the stream has ended}
+        self.response_cache: "OrderedDict[str, dict]" = OrderedDict()
+        # canonical service -> (targets/ports signature, allowed ports)
+        self._port_index: Dict[str, Tuple[tuple, frozenset]] = {}
+        # (host, port) -> (monotonic expiry, listening)
+        self._probe_cache: Dict[Tuple[str, int], Tuple[float, bool]] = {}
         self.upload_cleanup_stop = threading.Event()
         self.upload_cleanup_thread: Optional[threading.Thread] = None
 
     # lifecycle -------------------------------------------------
     def start(self):
-        for _ in range(max(1, self.workers_count)):
-            t = threading.Thread(target=self._http_worker, daemon=True)
+        for idx in range(max(1, self.workers_count)):
+            t = threading.Thread(target=self._http_worker, args=(idx,), daemon=True)
             t.start()
             self.workers.append(t)
         if not self.upload_cleanup_thread:
@@ -7501,8 +8179,8 @@ class RelayNode:
         self.bridge.start()
 
     def stop(self):
-        for _ in self.workers:
-            self.jobs.put(None)  # type: ignore
+        for idx in range(len(self.workers)):
+            self.jobs.put(None, idx)
         self.bridge.shutdown()
         self.upload_cleanup_stop.set()
         # Clear response cache
@@ -7524,12 +8202,12 @@ class RelayNode:
         self.current_address = addr
         self.address_callback(self.node_id, addr)
 
-    def _notify_nkn_traffic(self, direction: str, peer: str, payload: dict, event_name: str = "") -> None:
+    def _notify_nkn_traffic(self, direction: str, peer: str, payload: Any, event_name: str = "") -> None:
         cb = self.nkn_traffic_callback
         if not callable(cb):
             return
         try:
-            cb(direction, peer, payload if isinstance(payload, dict) else {}, event_name or "")
+            cb(direction, peer, payload if isinstance(payload, (dict, bytes)) else {}, event_name or "")
         except Exception:
             pass
 
@@ -7543,11 +8221,13 @@ class RelayNode:
             pass
 
     def _dm(self, target: str, payload: dict, opts: Optional[dict] = None) -> None:
-        self._notify_nkn_traffic("out", target, payload if isinstance(payload, dict) else {}, str((payload or {}).get("event") or ""))
-        if opts is None:
-            self.bridge.dm(target, payload)
-            return
-        self.bridge.dm(target, payload, opts)
+        # Encode once: the same bytes feed the bridge pipe and the traffic
+        # telemetry (which would otherwise json.dumps the payload again to size it).
+        self._dm_encoded(target, str((payload or {}).get("event") or ""), _json_dumps_bytes(payload), opts)
+
+    def _dm_encoded(self, target: str, event: str, data: bytes, opts: Optional[dict] = None) -> None:
+        self._notify_nkn_traffic("out", target, data, event)
+        self.bridge.dm_encoded(target, data, opts)
 
     def _handle_dm(self, src: str, body: dict):
         if not isinstance(body, dict):
@@ -7562,22 +8242,11 @@ class RelayNode:
                 coarse_service = "web_scrape"
             elif event.startswith("relay.") or event.startswith("http."):
                 coarse_service = self._canonical_service(body.get("service") or body.get("target"))
-        router_events = {
-            "resolve_tunnels",
-            "resolve_tunnels_result",
-            "service_rpc_request",
-            "service_rpc_result",
-        }
-        if event not in router_events:
+        if event not in ROUTER_DM_EVENTS:
             self._notify_nkn_traffic("in", src, body, event)
-        self.ui.bump(self.node_id, "IN", f"{event or '<unknown>'} {rid}")
-        self._record_flow(src, self.node_id, f"{event or '<unknown>'} {rid}", service=coarse_service, channel=src)
-        if self.router_event_handler and event in (
-            "resolve_tunnels",
-            "resolve_tunnels_result",
-            "service_rpc_request",
-            "service_rpc_result",
-        ):
+        label = f"{event or '<unknown>'} {rid}"
+        self._observe("IN", label, flow=(src, self.node_id, label), service=coarse_service, channel=src)
+        if self.router_event_handler and event in ROUTER_DM_EVENTS:
             try:
                 if self.router_event_handler(event, src, body, self):
                     return
@@ -7613,7 +8282,7 @@ class RelayNode:
 
             def _port_of(url: str) -> Optional[int]:
                 try:
-                    parsed = urllib.parse.urlparse(url)
+                    parsed = _parse_url(url)
                     port_val = parsed.port
                     if port_val:
                         return int(port_val)
@@ -7660,9 +8329,11 @@ class RelayNode:
             self._dm(src, health, DM_OPTS_SINGLE)
             return
         try:
-            if event == "asr.start":
-                req = req_from_asr_start(body)
-                if self._check_assignment("whisper_asr", src, rid):
+            builder = DM_REQUEST_BUILDERS.get(event)
+            if builder is not None:
+                build, service = builder
+                req = build(body)
+                if self._check_assignment(service, src, rid):
                     self._enqueue_request(src, rid, req)
                 return
             if event == "http.upload.begin":
@@ -7674,58 +8345,7 @@ class RelayNode:
             if event == "http.upload.end":
                 self._handle_upload_end(src, rid, body)
                 return
-            if event == "asr.audio":
-                req = req_from_asr_audio(body)
-                if self._check_assignment("whisper_asr", src, rid):
-                    self._enqueue_request(src, rid, req)
-                return
-            if event == "asr.end":
-                req = req_from_asr_end(body)
-                if self._check_assignment("whisper_asr", src, rid):
-                    self._enqueue_request(src, rid, req)
-                return
-            if event == "asr.events":
-                req = req_from_asr_events(body)
-                if self._check_assignment("whisper_asr", src, rid):
-                    self._enqueue_request(src, rid, req)
-                return
             if event.startswith("browser."):
-                if event == "browser.open":
-                    req = req_from_browser_open(body)
-                elif event == "browser.close":
-                    req = req_from_browser_close(body)
-                elif event == "browser.nav":
-                    req = req_from_browser_nav(body)
-                elif event == "browser.click":
-                    req = req_from_browser_click(body)
-                elif event == "browser.type":
-                    req = req_from_browser_type(body)
-                elif event == "browser.scroll":
-                    req = req_from_browser_scroll(body)
-                elif event == "browser.click_xy":
-                    req = req_from_browser_click_xy(body)
-                elif event == "browser.dom":
-                    req = req_from_browser_dom(body)
-                elif event == "browser.screenshot":
-                    req = req_from_browser_screenshot(body)
-                elif event == "browser.events":
-                    req = req_from_browser_events(body)
-                elif event == "browser.back":
-                    req = req_from_browser_back(body)
-                elif event == "browser.forward":
-                    req = req_from_browser_forward(body)
-                elif event == "browser.scroll_up":
-                    req = req_from_browser_scroll_up(body)
-                elif event == "browser.scroll_down":
-                    req = req_from_browser_scroll_down(body)
-                elif event == "browser.drag":
-                    req = req_from_browser_drag(body)
-                elif event == "browser.scroll_point":
-                    req = req_from_browser_scroll_point(body)
-                else:
-                    return
-                if self._check_assignment("web_scrape", src, rid):
-                    self._enqueue_request(src, rid, req)
                 return
         except Exception as e:
             self._dm(src, {
@@ -7758,6 +8378,10 @@ class RelayNode:
     def _canonical_service(self, hint: Optional[str]) -> Optional[str]:
         if not hint:
             return None
+        if type(hint) is str:
+            canonical = self._alias_fast.get(hint)
+            if canonical is not None:
+                return canonical
         hint = str(hint).lower()
         return self.alias_map.get(hint, hint)
 
@@ -7770,9 +8394,39 @@ class RelayNode:
         except Exception:
             pass
 
+    def _observe(self, kind: Optional[str], msg: str = "", flow: Optional[Tuple[str, str, str]] = None,
+                 direction: str = "→", service: Optional[str] = None, channel: Optional[str] = None,
+                 blocked: bool = False, usage: Optional[Tuple[int, int, Optional[float]]] = None,
+                 nkn_addr: str = "", bytes_sent: int = 0) -> None:
+        """Report one message to the UI as a single event (see ``EnhancedUI.observe``).
+
+        ``usage`` is ``(bytes_in, bytes_out, start_ts)``. UIs without ``observe``
+        get the equivalent bump/record_flow/stats calls.
+        """
+        observe = getattr(self.ui, "observe", None)
+        if observe is None:
+            if kind:
+                self.ui.bump(self.node_id, kind, msg)
+            if flow is not None:
+                self._record_flow(flow[0], flow[1], flow[2], service=service, channel=channel,
+                                  direction=direction, blocked=blocked)
+            if usage is not None:
+                self._record_usage_stats(service, channel or "", bytes_in=usage[0], bytes_out=usage[1],
+                                         start_ts=usage[2])
+            return
+        if usage is not None:
+            start_ts = usage[2]
+            duration_s = max(0.0, time.time() - start_ts) if start_ts is not None else 0.0
+            usage = (usage[0], usage[1], duration_s)
+        try:
+            observe(self.node_id, kind, msg, flow=flow, direction=direction, service=service,
+                    channel=channel, blocked=blocked, usage=usage, nkn_addr=nkn_addr, bytes_sent=bytes_sent)
+        except Exception:
+            pass
+
     def _flow_target_label(self, service: Optional[str], url: str) -> str:
         try:
-            parsed = urllib.parse.urlparse(url)
+            parsed = _parse_url(url)
             host = parsed.netloc or parsed.path
         except Exception:
             host = url
@@ -7797,17 +8451,19 @@ class RelayNode:
     def _estimate_body_bytes(self, req: dict) -> int:
         """Best-effort estimate of request body size for stats."""
         try:
+            if req.get("_raw_body") is not None:
+                return _raw_body_len(req["_raw_body"])
             if "body_b64" in req and req["body_b64"] is not None:
-                return len(base64.b64decode(str(req["body_b64"]), validate=False))
+                return _b64_decoded_len(req["body_b64"])
             if "data" in req and req["data"] is not None:
                 val = req["data"]
                 return len(val) if isinstance(val, (bytes, bytearray)) else len(str(val).encode("utf-8"))
             if "json" in req and req["json"] is not None:
-                return len(json.dumps(req["json"]).encode("utf-8"))
+                return len(_json_dumps_bytes(req["json"]))
             if req.get("body_chunks_b64"):
-                return sum(len(base64.b64decode(str(c), validate=False)) for c in req.get("body_chunks_b64") if c is not None)
+                return sum(_b64_decoded_len(c) for c in req["body_chunks_b64"] if c is not None)
             if req.get("json_chunks_b64"):
-                return sum(len(base64.b64decode(str(c), validate=False)) for c in req.get("json_chunks_b64") if c is not None)
+                return sum(_b64_decoded_len(c) for c in req["json_chunks_b64"] if c is not None)
         except Exception:
             return 0
         return 0
@@ -7832,8 +8488,8 @@ class RelayNode:
             if not addr:
                 payload["error"] = "service currently offline"
             self._dm(src, payload, DM_OPTS_SINGLE)
-            self.ui.bump(self.node_id, "OUT", f"redirect {service_name} -> {node_id}")
-            self._record_flow(src, node_id, f"redirect {service_name} {rid}", service=service_name, channel=src)
+            self._observe("OUT", f"redirect {service_name} -> {node_id}",
+                          flow=(src, node_id, f"redirect {service_name} {rid}"), service=service_name, channel=src)
             return False
         return True
 
@@ -7843,9 +8499,28 @@ class RelayNode:
         return (None, None)
 
     def _enqueue_request(self, src: str, rid: str, req: dict):
-        self.jobs.put({"src": src, "id": rid, "req": req})
+        # Steer by service so its requests hit the same worker's connection pool.
+        key = self._canonical_service((req or {}).get("service") or (req or {}).get("target")) or rid
+        self.jobs.put({"src": src, "id": rid, "req": req}, key)
+        self._update_queue_gauge()
+
+    def _ui_due(self, kind: str) -> bool:
+        """Rate-limit per-chunk/per-job UI chatter to one update per UI_UPDATE_INTERVAL_S."""
+        now = time.monotonic()
+        if now < self._ui_next.get(kind, 0.0):
+            return False
+        self._ui_next[kind] = now + UI_UPDATE_INTERVAL_S
+        return True
+
+    def _update_queue_gauge(self) -> None:
+        size = self.jobs.qsize()
+        # An empty queue is always shown so the gauge never sticks on a stale depth.
+        if size and not self._ui_due("queue"):
+            self._queue_gauge_stale = True
+            return
+        self._queue_gauge_stale = False
         try:
-            self.ui.set_queue(self.node_id, self.jobs.qsize())
+            self.ui.set_queue(self.node_id, size)
         except Exception:
             pass
 
@@ -7856,43 +8531,50 @@ class RelayNode:
             return True  # Port isolation disabled, allow all requests
 
         try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url)
-            port = parsed.port
-            if port is None:
-                port = 443 if parsed.scheme == "https" else 80
+            port = _port_of_url(url)
 
             # Canonicalize service so aliases map correctly
             svc = self._canonical_service(service) if service else ""
-
-            # Start with statically whitelisted ports
-            allowed_ports: set[int] = set()
-            for svc_key, target_info in SERVICE_TARGETS.items():
-                if svc and svc != svc_key and svc not in target_info.get("aliases", []):
-                    continue
-                for p in target_info.get("ports", []):
-                    allowed_ports.add(int(p))
-
-            # Add ports from configured targets (so custom endpoints are honored while isolation is on)
-            for target_name, base_url in (self.targets or {}).items():
-                if svc and svc != target_name and svc != self._canonical_service(target_name):
-                    continue
-                try:
-                    t_parsed = urlparse(base_url)
-                    t_port = t_parsed.port
-                    if t_port is None:
-                        t_port = 443 if t_parsed.scheme == "https" else 80
-                    if t_port:
-                        allowed_ports.add(int(t_port))
-                except Exception:
-                    continue
-
-            return port in allowed_ports
+            return port in self._allowed_ports(svc)
         except Exception:
             # If we can't parse the URL, reject it for security
             return False
         
+    def _allowed_ports(self, svc: str) -> frozenset:
+        """Whitelisted ports for a canonical service ("" means any service).
+
+        Cached per service; the entry is rebuilt whenever the targets map or
+        the (append-only) SERVICE_TARGETS port lists have changed since.
+        """
+        targets = self.targets or {}
+        sig = (tuple(targets.items()), sum(len(info.get("ports", ())) for info in SERVICE_TARGETS.values()))
+        cached = self._port_index.get(svc)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+
+        # Start with statically whitelisted ports
+        allowed_ports: set[int] = set()
+        for svc_key, target_info in SERVICE_TARGETS.items():
+            if svc and svc not in _default_aliases(svc_key):
+                continue
+            for p in target_info.get("ports", []):
+                allowed_ports.add(int(p))
+
+        # Add ports from configured targets (so custom endpoints are honored while isolation is on)
+        for target_name, base_url in targets.items():
+            if svc and svc != target_name and svc != self._canonical_service(target_name):
+                continue
+            try:
+                t_port = _port_of_url(base_url)
+                if t_port:
+                    allowed_ports.add(int(t_port))
+            except Exception:
+                continue
+
+        allowed = frozenset(allowed_ports)
+        self._port_index[svc] = (sig, allowed)
+        return allowed
+
     def _realign_service_target(self, service_name: Optional[str], failed_url: str) -> bool:
         """
         After a connection failure, try to detect the service's actual port from its log,
@@ -7908,7 +8590,7 @@ class RelayNode:
             return False
 
         try:
-            parsed = urllib.parse.urlparse(failed_url)
+            parsed = _parse_url(failed_url)
         except Exception:
             parsed = None
 
@@ -7932,29 +8614,11 @@ class RelayNode:
 
     def _detect_service_port_from_log(self, service_name: str) -> Optional[int]:
         """Best-effort detection of a service port by tailing its log."""
-        log_file = LOGS_ROOT / f"{service_name}.log"
+        log_file = SERVICE_LOG_PATHS.get(service_name) or LOGS_ROOT / f"{service_name}.log"
         if not log_file.exists():
             return None
         try:
-            import re
-
-            with open(log_file, "r") as f:
-                lines = f.readlines()[-100:]
-            patterns = [
-                r"Running on .*:(\d+)",
-                r"listening on .*:(\d+)",
-                r"Listening on port (\d+)",
-                r"Server.*port (\d+)",
-                r"Started.*:(\d+)",
-                r"http://[^:]+:(\d+)",
-            ]
-            for line in reversed(lines):
-                for pattern in patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        port = int(match.group(1))
-                        if 1024 <= port <= 65535:
-                            return port
+            return _port_from_log_text(_tail_text(log_file, 100))
         except Exception as exc:  # pragma: no cover
             LOGGER.debug("On-demand port detection failed for %s: %s", service_name, exc)
         return None
@@ -7965,7 +8629,7 @@ class RelayNode:
         target_key = info.get("target") or service
         base = self.targets.get(target_key) or info.get("endpoint") or ""
         try:
-            parsed = urllib.parse.urlparse(base)
+            parsed = _parse_url(base)
             return parsed.hostname
         except Exception:
             return None
@@ -7974,20 +8638,26 @@ class RelayNode:
         """Treat loopback hostnames as equivalent when comparing."""
         if not left or not right:
             return False
-        loopbacks = {"127.0.0.1", "localhost"}
-        if left in loopbacks and right in loopbacks:
-            return True
-        return left == right
+        return left == right or (left in _LOOPBACK_HOSTS and right in _LOOPBACK_HOSTS)
 
     def _probe_service_port(self, host: str, port: int, timeout: float = 0.35) -> bool:
-        """Lightweight TCP probe to confirm the port is listening."""
-        try:
-            import socket
+        """Lightweight TCP probe to confirm the port is listening.
 
+        Results are cached briefly so a burst of requests that miss the
+        whitelist does not pay a connect (up to ``timeout``) per request.
+        """
+        key = (host, port)
+        now = time.monotonic()
+        cached = self._probe_cache.get(key)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        try:
             with socket.create_connection((host, port), timeout=timeout):
-                return True
+                ok = True
         except Exception:
-            return False
+            ok = False
+        self._probe_cache[key] = (now + (PROBE_CACHE_OK_S if ok else PROBE_CACHE_FAIL_S), ok)
+        return ok
 
     def _whitelist_service_port(self, service: str, port: int, host: Optional[str], scheme: Optional[str], reason: str, require_probe: bool = False) -> bool:
         """Whitelist + align a service port and target endpoint immediately."""
@@ -8007,6 +8677,7 @@ class RelayNode:
         changed = False
         if port not in ports:
             ports.append(port)
+            self._port_index.clear()
             LOGGER.info("Port isolation: added port %s for %s (%s)", port, svc, reason)
             changed = True
 
@@ -8016,7 +8687,7 @@ class RelayNode:
         base_scheme = None
         try:
             if base_hint:
-                parsed = urllib.parse.urlparse(base_hint)
+                parsed = _parse_url(base_hint)
                 base_host = parsed.hostname
                 base_scheme = parsed.scheme
         except Exception:
@@ -8048,10 +8719,10 @@ class RelayNode:
         if not svc:
             return False
         try:
-            parsed = urllib.parse.urlparse(url)
+            parsed = _parse_url(url)
         except Exception:
             return False
-        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        port = _url_port(parsed)
         cfg_host = self._service_host_hint(svc)
         requested_host = parsed.hostname
         host_hint = cfg_host or requested_host or "127.0.0.1"
@@ -8104,32 +8775,61 @@ class RelayNode:
 
         return resolved_url
 
-    def _http_request_with_retry(self, session: requests.Session, method: str, url: str, **kwargs):
+    def _http_request_with_retry(self, session: requests.Session, method: str, url: str, *,
+                                 headers: Dict[str, Any], timeout: float, verify: bool,
+                                 data: Any = None, json_body: Any = None, stream: bool = False):
+        # The first request of a worker job resumes at the job's attempt count and,
+        # when other jobs are queued, parks the job for its backoff (_DeferredRetry)
+        # instead of sleeping the worker. Later calls (realign) retry inline.
+        job = getattr(self._retry_ctx, "job", None)
+        self._retry_ctx.job = None
+        first = int(job.get("attempt") or 0) if job is not None else 0
         last_exc = None
-        for attempt in range(self.retry_attempts):
+        rewind = getattr(data, "seek", None)
+        for attempt in range(first, self.retry_attempts):
+            if rewind is not None:
+                rewind(0)  # spooled upload body: resend from the start
             try:
-                return session.request(method, url, **kwargs)
+                return session.request(method, url, headers=headers, timeout=timeout, verify=verify,
+                                       data=data, json=json_body, stream=stream)
             except requests.RequestException as exc:
                 last_exc = exc
-                time.sleep(min(self.retry_backoff * (2 ** attempt), self.retry_cap))
+                if attempt + 1 >= self.retry_attempts:
+                    break
+                delay = min(self.retry_backoff * (2 ** attempt), self.retry_cap)
+                if job is not None and self.jobs.qsize() > 0:
+                    job["attempt"] = attempt + 1
+                    raise _DeferredRetry(delay) from exc
+                time.sleep(delay)
         if last_exc is not None:
             raise last_exc
         raise RuntimeError("request failed")
 
-    def _http_worker(self):
+    @staticmethod
+    def _new_session() -> requests.Session:
+        # One keep-alive pool per target host, kept for the worker's lifetime.
         session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _http_worker(self, idx: int = 0):
+        session = self._new_session()
         while True:
-            job = self.jobs.get()
+            job = self.jobs.get(idx)
             if job is None:
                 break
             src = job.get("src")
             rid = job.get("id")
             req = job.get("req") or {}
             service_name = self._canonical_service(req.get("service") or req.get("target")) or self.primary_service
-            body_bytes = self._estimate_body_bytes(req)
             start_ts = time.time()
+            self._retry_ctx.job = job
             try:
                 self._process_request(session, src, rid, req)
+            except _DeferredRetry as deferred:
+                self.jobs.put_later(job, time.monotonic() + deferred.delay)
             except Exception as e:
                 blocked = isinstance(e, ValueError) and "port isolation" in str(e).lower()
 
@@ -8149,7 +8849,7 @@ class RelayNode:
                 method = (req.get("method") or "GET").upper()
                 path_snippet = req.get("path") or "/"
                 try:
-                    parsed = urllib.parse.urlparse(url) if url else None
+                    parsed = _parse_url(url) if url else None
                     hostport = parsed.netloc if parsed else ""
                 except Exception:
                     hostport = ""
@@ -8164,15 +8864,6 @@ class RelayNode:
                 else:
                     payload = f"ERROR {type(e).__name__} {method} {loc}: {e}"
 
-                self._record_flow(
-                    src or "client",
-                    target_label,
-                    payload,
-                    service=service_name,
-                    channel=src,
-                    blocked=blocked,
-                )
-
                 self._dm(src, {
                     "event": "relay.response",
                     "id": rid,
@@ -8184,21 +8875,26 @@ class RelayNode:
                     "truncated": False,
                     "error": f"{type(e).__name__}: {e}",
                 }, DM_OPTS_SINGLE)
-                self.ui.bump(self.node_id, "ERR", f"http {type(e).__name__}: {e}")
-                self._record_usage_stats(service_name, src, bytes_in=body_bytes, bytes_out=0, start_ts=start_ts)
+                self._observe(
+                    "ERR",
+                    f"http {type(e).__name__}: {e}",
+                    flow=(src or "client", target_label, payload),
+                    service=service_name,
+                    channel=src,
+                    blocked=blocked,
+                    usage=(self._estimate_body_bytes(req), 0, start_ts),
+                )
 
             finally:
-                self.jobs.task_done()
-                try:
-                    self.ui.set_queue(self.node_id, self.jobs.qsize())
-                except Exception:
-                    pass
+                self._update_queue_gauge()
 
     def _process_request(self, session: requests.Session, src: str, rid: str, req: dict):
         start_ts = time.time()
         url = self._resolve_url(req)
         method = (req.get("method") or "GET").upper()
         headers = req.get("headers") or {}
+        # Lowercased view for lookups; headers itself is what gets sent.
+        headers_lc = {str(k).lower(): v for k, v in headers.items()}
         timeout_s = float(req.get("timeout_ms") or 30000) / 1000.0
 
         verify = self.verify_default
@@ -8210,36 +8906,21 @@ class RelayNode:
         service_name = self._canonical_service(req.get("service") or req.get("target")) or self.primary_service
         endpoint_label = ""
         with contextlib.suppress(Exception):
-            parsed_endpoint = urllib.parse.urlparse(url)
+            parsed_endpoint = _parse_url(url)
             endpoint_base = f"{parsed_endpoint.scheme}://{parsed_endpoint.netloc}" if parsed_endpoint.netloc else url
             endpoint_label = f"{service_name}:{endpoint_base}"
         if endpoint_label:
             self._notify_endpoint_usage(src or "unknown", [endpoint_label])
 
         # Look up service definition from the watchdog, not from RelayNode
-        svc_def = None
-        if service_name:
-            try:
-                from router import ServiceWatchdog  # if this file is named differently, drop the import and just use ServiceWatchdog directly
-            except ImportError:
-                # Same module, name already in globals – safe to ignore
-                pass
-            try:
-                svc_def = next(
-                    (d for d in ServiceWatchdog.DEFINITIONS if d.name == service_name),
-                    None,
-                )
-            except Exception:
-                svc_def = None
+        svc_def = SERVICE_DEFINITIONS_BY_NAME.get(service_name) if service_name else None
 
         # Derive target label + host:port + path for logging
         target_label = self._flow_target_label(service_name, url)
         try:
-            parsed = urllib.parse.urlparse(url)
+            parsed = _parse_url(url)
             path_snippet = parsed.path or "/"
-            port = parsed.port
-            if port is None:
-                port = 443 if parsed.scheme == "https" else 80
+            port = _url_port(parsed)
             host_port = ""
             if parsed.hostname:
                 host_port = f"{parsed.hostname}:{port}" if port else parsed.hostname
@@ -8250,52 +8931,58 @@ class RelayNode:
             host_port = ""
 
         want_stream = False
-        stream_mode = str(req.get("stream") or headers.get("X-Relay-Stream") or "").strip().lower()
+        stream_mode = str(req.get("stream") or headers_lc.get("x-relay-stream") or "").strip().lower()
         if stream_mode in ("1", "true", "yes", "on", "chunks", "dm", "lines", "ndjson", "sse", "events"):
             want_stream = True
         if svc_def and getattr(svc_def, "default_stream", False):
             want_stream = True
-            if "X-Relay-Stream" not in headers and "x-relay-stream" not in headers:
+            if "x-relay-stream" not in headers_lc:
                 headers["X-Relay-Stream"] = "chunks"
 
-        params: Dict[str, Any] = {"headers": headers, "timeout": timeout_s, "verify": verify}
+        data: Any = None
+        json_body: Any = None
         body_bytes = 0
         body_chunks = req.get("body_chunks_b64") or []
         json_chunks = req.get("json_chunks_b64") or []
 
         if body_chunks:
             try:
-                combined = b"".join(
-                    base64.b64decode(str(c), validate=False) for c in body_chunks if c is not None
-                )
+                combined = _b64decode_chunks(body_chunks)
             except Exception:
                 combined = b""
-            params["data"] = combined
+            data = combined
             body_bytes = len(combined)
         elif json_chunks:
             try:
-                combined = b"".join(
-                    base64.b64decode(str(c), validate=False) for c in json_chunks if c is not None
-                )
-                params["data"] = combined
-                headers.setdefault("Content-Type", "application/json")
+                combined = _b64decode_chunks(json_chunks)
+                data = combined
+                if "content-type" not in headers_lc:
+                    headers["Content-Type"] = "application/json"
             except Exception:
-                params["data"] = b""
-            body_bytes = len(params.get("data") or b"")
+                data = b""
+            body_bytes = len(data or b"")
         elif "json" in req and req["json"] is not None:
-            params["json"] = req["json"]
+            # Serialize once and send the bytes; passing json= would make
+            # requests encode the payload a second time after sizing it.
             try:
-                body_bytes = len(json.dumps(req["json"]).encode("utf-8"))
+                data = _json_dumps_bytes(req["json"])
+                if "content-type" not in headers_lc:
+                    headers["Content-Type"] = "application/json"
+                body_bytes = len(data)
             except Exception:
+                json_body = req["json"]
                 body_bytes = 0
+        elif req.get("_raw_body") is not None:
+            data = req["_raw_body"]
+            body_bytes = _raw_body_len(data)
         elif "body_b64" in req and req["body_b64"] is not None:
             try:
-                params["data"] = base64.b64decode(str(req["body_b64"]), validate=False)
+                data = _b64decode(str(req["body_b64"]))
             except Exception:
-                params["data"] = b""
-            body_bytes = len(params.get("data") or b"")
+                data = b""
+            body_bytes = len(data or b"")
         elif "data" in req and req["data"] is not None:
-            params["data"] = req["data"]
+            data = req["data"]
             try:
                 body_bytes = (
                     len(req["data"])
@@ -8307,6 +8994,13 @@ class RelayNode:
 
         realigned = False  # Ensure we only realign/retry once per request
 
+        def _request(stream: bool) -> requests.Response:
+            # url is read at call time, so a realigned target is picked up.
+            return self._http_request_with_retry(
+                session, method, url, headers=headers, timeout=timeout_s, verify=verify,
+                data=data, json_body=json_body, stream=stream,
+            )
+
         def _retry_after_realign(exc: Exception, stream: bool = False) -> requests.Response:
             nonlocal url, target_label, path_snippet, host_port, realigned
 
@@ -8326,11 +9020,9 @@ class RelayNode:
             url = self._resolve_url(req)
             target_label = self._flow_target_label(service_name, url)
             try:
-                parsed2 = urllib.parse.urlparse(url)
+                parsed2 = _parse_url(url)
                 path_snippet = parsed2.path or "/"
-                port2 = parsed2.port
-                if port2 is None:
-                    port2 = 443 if parsed2.scheme == "https" else 80
+                port2 = _url_port(parsed2)
                 host_port = ""
                 if parsed2.hostname:
                     host_port = f"{parsed2.hostname}:{port2}" if port2 else parsed2.hostname
@@ -8340,14 +9032,12 @@ class RelayNode:
                 path_snippet = "/"
                 host_port = ""
 
-            if stream:
-                return self._http_request_with_retry(session, method, url, stream=True, **params)
-            return self._http_request_with_retry(session, method, url, **params)
+            return _request(stream)
 
         # --- streaming path ---
         if want_stream:
             try:
-                resp = self._http_request_with_retry(session, method, url, stream=True, **params)
+                resp = _request(True)
             except requests.RequestException as exc:
                 # Try one fast realign + retry on connection failure
                 resp = _retry_after_realign(exc, stream=True)
@@ -8365,43 +9055,43 @@ class RelayNode:
                 return
 
             self._reset_rate_limit()
-            stream_mode_resolved = self._infer_stream_mode(stream_mode, resp)
-            bytes_out = self._handle_stream(
-                src, rid, resp, stream_mode_resolved, service_name, body_bytes, start_ts
-            )
+            meta = self._response_headers(resp)
+            stream_mode_resolved = self._infer_stream_mode(stream_mode, resp, meta)
+            try:
+                bytes_out = self._handle_stream(
+                    src, rid, resp, stream_mode_resolved, service_name, body_bytes, start_ts, meta
+                )
+            finally:
+                # Hand the socket back to the worker's keep-alive pool (or drop it
+                # if the body was not drained) instead of waiting for GC.
+                resp.close()
             stream_loc = f"{host_port}{path_snippet}" if host_port else path_snippet
-            self._record_flow(
-                target_label,
-                src or "client",
-                f"STREAM {resp.status_code} {method} {stream_loc} {rid}",
+            self._observe(
+                None,
+                flow=(target_label, src or "client", f"STREAM {resp.status_code} {method} {stream_loc} {rid}"),
+                direction="←",
                 service=service_name,
                 channel=src,
-                direction="←",
-            )
-            self._record_usage_stats(
-                service_name, src, bytes_in=body_bytes, bytes_out=bytes_out, start_ts=start_ts
+                usage=(body_bytes, bytes_out, start_ts),
             )
             return
 
         # --- non-streaming path ---
         try:
-            resp = self._http_request_with_retry(session, method, url, **params)
+            resp = _request(False)
         except requests.RequestException as exc:
             resp = _retry_after_realign(exc, stream=False)
 
         self._handle_response_status(resp.status_code)
         bytes_out = self._send_simple_response(src, rid, resp, req)
         resp_loc = f"{host_port}{path_snippet}" if host_port else path_snippet
-        self._record_flow(
-            target_label,
-            src or "client",
-            f"RESP {resp.status_code} {method} {resp_loc} {rid}",
+        self._observe(
+            None,
+            flow=(target_label, src or "client", f"RESP {resp.status_code} {method} {resp_loc} {rid}"),
+            direction="←",
             service=service_name,
             channel=src,
-            direction="←",
-        )
-        self._record_usage_stats(
-            service_name, src, bytes_in=body_bytes, bytes_out=bytes_out, start_ts=start_ts
+            usage=(body_bytes, bytes_out, start_ts),
         )
 
 
@@ -8463,22 +9153,41 @@ class RelayNode:
             if not entry.get("total") and total:
                 entry["total"] = total
                 entry["chunks"] = [None] * total
+                entry["buf"] = bytearray()
+                entry["next"] = 0
+                # Bytes already spooled belong to the discarded layout too.
+                spool = entry.pop("spool", None)
+                if spool is not None:
+                    spool.close()
             self._log_upload(rid, f"begin merge total={entry.get('total')}")
         else:
-            entry = {
-                "src": src,
-                "rid": rid,
-                "req": req,
-                "chunks": [None] * total if total > 0 else [],
-                "total": total,
-                "got": 0,
-                "ended": False,
-                "ctype": ctype,
-                "created": time.time(),
-            }
-            self.upload_sessions[uid] = entry
+            self._open_upload_session(uid, src, rid, req, total, ctype)
             self._log_upload(rid, f"begin total={total}")
 
+    def _open_upload_session(self, uid: str, src: str, rid: str, req: dict, total: int, ctype: str) -> dict:
+        """Register a new upload session, evicting the oldest past UPLOAD_SESSIONS_MAX."""
+        entry = {
+            "src": src,
+            "rid": rid,
+            "req": req,
+            "chunks": [None] * total if total > 0 else [],
+            "buf": bytearray(),
+            "next": 0,
+            "total": total,
+            "got": 0,
+            "ended": False,
+            "ctype": ctype,
+            "created": time.time(),
+        }
+        sessions = self.upload_sessions
+        sessions[uid] = entry
+        self._schedule_upload_check(uid, entry["created"] + 20)
+        while len(sessions) > UPLOAD_SESSIONS_MAX:
+            old_uid, old = sessions.popitem(last=False)
+            self._send_upload_error(old.get("src") or "", old.get("rid") or old_uid,
+                                    "upload evicted (too many concurrent uploads)", 503)
+        return entry
+
     def _handle_upload_chunk(self, src: str, rid: str, body: dict) -> None:
         uid = body.get("upload_id") or rid
         entry = self.upload_sessions.get(uid)
@@ -8497,22 +9206,19 @@ class RelayNode:
                 return
             total_chunks = int(body.get("total") or body.get("total_chunks") or 0)
             ctype = body.get("content_type") or (req.get("headers") or {}).get("Content-Type") or ""
-            entry = {
-                "src": src,
-                "rid": rid,
-                "req": req,
-                "chunks": [None] * total_chunks if total_chunks > 0 else [],
-                "total": total_chunks,
-                "got": 0,
-                "ended": False,
-                "ctype": ctype,
-                "created": time.time(),
-            }
-            self.upload_sessions[uid] = entry
+            entry = self._open_upload_session(uid, src, rid, req, total_chunks, ctype)
             self._log_upload(rid, f"implicit begin from chunk total={total_chunks}")
         b64 = body.get("b64") or ""
+        if not isinstance(b64, (str, bytes)):
+            b64 = str(b64)
+        # Every 4 text chars decode to at most 3 bytes, so an oversized chunk
+        # is rejected before paying for its decode.
+        if (len(b64) // 4) * 3 > self.chunk_upload_b + 2:
+            self._send_upload_error(src, rid, f"chunk too large (~{(len(b64) // 4) * 3} > {self.chunk_upload_b})", 413)
+            self.upload_sessions.pop(uid, None)
+            return
         try:
-            raw = base64.b64decode(str(b64), validate=False)
+            raw = _b64decode(b64)
         except Exception:
             self._send_upload_error(src, rid, "invalid chunk b64", 400)
             return
@@ -8528,15 +9234,48 @@ class RelayNode:
         if total > 0:
             if entry["chunks"][seq - 1] is None:
                 entry["got"] += 1
-            entry["chunks"][seq - 1] = raw
+                entry["chunks"][seq - 1] = raw
+                self._flush_upload_chunks(entry)
         else:
             entry["chunks"].append(raw)
             entry["got"] += 1
+            self._flush_upload_chunks(entry)
         entry["last"] = time.time()
-        self._log_upload(rid, f"chunk {seq}/{total or '?'} got={entry['got']}")
+        if self._ui_due("upload") or (total > 0 and entry["got"] >= total):
+            self._log_upload(rid, f"chunk {seq}/{total or '?'} got={entry['got']}")
         if entry.get("ended") and ((total > 0 and entry["got"] >= total) or total == 0):
             self._finalize_upload(uid, entry)
 
+    @staticmethod
+    def _flush_upload_chunks(entry: dict) -> None:
+        """Move the contiguous run of received chunks into the session buffer.
+
+        ``chunks`` keeps one slot per seq: None while missing, the decoded bytes
+        while waiting on an earlier gap, and the chunk length once its bytes
+        live in ``buf``. In-order uploads therefore hold a single bytearray
+        rather than a list of chunk objects plus a joined copy.
+        """
+        chunks = entry["chunks"]
+        buf = entry["buf"]
+        spool = entry.get("spool")
+        idx = entry["next"]
+        while idx < len(chunks) and isinstance(chunks[idx], (bytes, bytearray)):
+            raw = chunks[idx]
+            if spool is not None:
+                spool.write(raw)
+            else:
+                buf += raw
+            chunks[idx] = len(raw)
+            idx += 1
+        entry["next"] = idx
+        if spool is None and len(buf) > UPLOAD_SPOOL_BYTES:
+            # Large upload: keep the body on disk from here on; the worker
+            # sends the file as-is instead of a bytes copy of it.
+            spool = tempfile.TemporaryFile()
+            spool.write(buf)
+            entry["spool"] = spool
+            entry["buf"] = bytearray()
+
     def _handle_upload_end(self, src: str, rid: str, body: dict) -> None:
         uid = body.get("upload_id") or rid
         entry = self.upload_sessions.get(uid)
@@ -8545,6 +9284,7 @@ class RelayNode:
             return
         entry["ended"] = True
         entry["end_received_time"] = time.time()  # Track when end was received
+        self._schedule_upload_check(uid, entry["end_received_time"] + 2.0)
         total = entry.get("total") or 0
         self._log_upload(rid, f"end received got={entry['got']} total={total}")
         if total == 0 or entry["got"] >= total:
@@ -8554,7 +9294,9 @@ class RelayNode:
 
     def _finalize_upload(self, uid: str, entry: dict, allow_partial: bool = False) -> None:
         chunks = entry.get("chunks") or []
-        missing = [i + 1 for i, ch in enumerate(chunks) if ch is None]
+        # Every slot before "next" is already flushed into buf, so only the tail can have gaps.
+        flushed = entry.get("next", 0)
+        missing = [i + 1 for i in range(flushed, len(chunks)) if chunks[i] is None]
         if missing and not allow_partial:
             # Add grace period: don't request missing chunks if we just received 'end'
             # Give in-flight packets 2-3 seconds to arrive before requesting resend
@@ -8573,24 +9315,60 @@ class RelayNode:
                 return
 
             entry["missing_requested"] = now
+            self._schedule_upload_check(uid, now + 10)
             self._request_missing(uid, entry, missing)
             return
-        data = b"".join(ch for ch in chunks if ch is not None)
-        req = dict(entry.get("req") or {})
+        # The body is handed to the worker whole rather than streamed to the
+        # backend while chunks arrive: chunks can land out of order and be
+        # re-requested after "end", JSON bodies are parsed in one piece, and
+        # _http_request_with_retry / realign need a body they can resend.
+        data = entry.get("buf")
+        if data is None:
+            data = bytearray()
+        spool = entry.get("spool")
+        # Partial upload: append whatever arrived after the first gap, in place.
+        for ch in itertools.islice(chunks, flushed, None):
+            if isinstance(ch, (bytes, bytearray)):
+                if spool is not None:
+                    spool.write(ch)
+                else:
+                    data += ch
+        # Drop the session first: nothing else can reach entry["req"], so it is
+        # completed in place and handed to the worker without a copy.
+        self.upload_sessions.pop(uid, None)
+        req = entry.get("req") or {}
         ctype = entry.get("ctype") or (req.get("headers") or {}).get("Content-Type") or ""
-        if "application/json" in ctype:
+        if spool is not None and "application/json" in ctype:
+            # JSON is parsed whole anyway.
+            spool.seek(0)
+            data = bytearray(spool.read())
+            spool.close()
+            spool = None
+        size = len(data)
+        if spool is not None:
+            size = spool.tell()
+            spool.seek(0)
+            req["_raw_body"] = spool
+        elif "application/json" in ctype:
             try:
                 text = data.decode("utf-8", errors="ignore")
-                req["json"] = json.loads(text)
+                req["json"] = _json_loads(text)
             except Exception:
-                req["body_b64"] = base64.b64encode(data).decode("ascii")
+                req["_raw_body"] = bytes(data)
         else:
-            req["body_b64"] = base64.b64encode(data).decode("ascii")
+            # Local hand-off to a worker: skip the base64 round trip body_b64 would cost.
+            req["_raw_body"] = bytes(data)
         self._enqueue_request(entry.get("src") or "", entry.get("rid") or "", req)
         missing_note = f" missing={len(missing)}" if missing else ""
-        self._log_upload(entry.get("rid") or uid, f"complete bytes={len(data)}{missing_note}")
-        # Only drop the session once we’ve enqueued the HTTP request (or finalized partial)
-        self.upload_sessions.pop(uid, None)
+        self._log_upload(entry.get("rid") or uid, f"complete bytes={size}{missing_note}")
+
+    def _cache_response(self, rid: str, entry: dict) -> None:
+        cache = self.response_cache
+        cache[rid] = entry
+        with contextlib.suppress(KeyError):
+            cache.move_to_end(rid)
+            while len(cache) > RESPONSE_CACHE_MAX:
+                cache.popitem(last=False)
 
     def _handle_response_missing(self, src: str, rid: str, missing: List[int]) -> None:
         if not missing:
@@ -8600,26 +9378,20 @@ class RelayNode:
             return
         chunks = cache.get("chunks") or {}
         for seq in missing:
-            b64 = chunks.get(seq)
-            if not b64:
+            data = chunks.get(seq)
+            if not data:
                 continue
-            payload = {
-                "event": "relay.response.chunk",
-                "id": rid,
-                "seq": seq,
-                "b64": b64,
-            }
-            self._dm(src, payload, DM_OPTS_STREAM)
+            self._dm_encoded(src, "relay.response.chunk", data, DM_OPTS_STREAM)
 
     def _upload_cleanup_loop(self) -> None:
-        """Sweep unfinished uploads so they don't stall forever."""
+        """Sweep unfinished uploads so they don't stall forever (and expired response caches)."""
         while not self.upload_cleanup_stop.is_set():
             try:
                 now = time.time()
                 to_finish: List[Tuple[str, dict]] = []
                 to_retry: List[Tuple[str, dict]] = []  # For grace period retry
                 to_error: List[Tuple[str, dict]] = []
-                for uid, entry in list(self.upload_sessions.items()):
+                for uid, entry in self._due_upload_sessions(now):
                     created = float(entry.get("created") or now)
                     age = now - created
                     got = int(entry.get("got") or 0)
@@ -8661,19 +9433,56 @@ class RelayNode:
                     self._log_upload(rid, "cleanup timeout (no chunks)")
                     self._send_upload_error(src, rid, "upload timed out before chunks arrived", 408)
                     self.upload_sessions.pop(uid, None)
+                self._sweep_response_cache(time.monotonic())
+                if self._queue_gauge_stale:
+                    # Last update of a burst was suppressed; show the settled depth.
+                    self._queue_gauge_stale = False
+                    self.ui.set_queue(self.node_id, self.jobs.qsize())
             except Exception:
                 pass
             self.upload_cleanup_stop.wait(2.0)
 
+    def _schedule_upload_check(self, uid: str, at: float) -> None:
+        with self._upload_deadlines_lock:
+            heapq.heappush(self._upload_deadlines, (at, uid))
+
+    def _due_upload_sessions(self, now: float) -> List[Tuple[str, dict]]:
+        """Sessions with a check deadline at or before ``now``, each listed once.
+
+        Idle uploads cost nothing per sweep; stale deadlines (session already
+        finished or evicted) simply drop out. A millisecond of slack keeps float
+        rounding from popping a session just short of its age threshold.
+        """
+        uids: List[str] = []
+        with self._upload_deadlines_lock:
+            heap = self._upload_deadlines
+            while heap and heap[0][0] <= now - 0.001:
+                uids.append(heapq.heappop(heap)[1])
+        due: List[Tuple[str, dict]] = []
+        for uid in dict.fromkeys(uids):
+            entry = self.upload_sessions.get(uid)
+            if entry is not None:
+                due.append((uid, entry))
+        return due
+
+    def _sweep_response_cache(self, now: float) -> None:
+        """Drop finished streams whose resend window has passed."""
+        cache = self.response_cache
+        for rid, entry in list(cache.items()):
+            expires_at = entry.get("expires_at")
+            if expires_at is not None and expires_at <= now:
+                cache.pop(rid, None)
+
     def _register_rate_limit_hit(self) -> None:
-        now = time.time()
+        # Monotonic: the 60s windows must not stretch or collapse on wall-clock jumps.
+        now = time.monotonic()
         if self.rate_limit_since is None:
             self.rate_limit_since = now
         self.last_rate_limit = now
         self.rate_limit_hits.append(now)
         while self.rate_limit_hits and now - self.rate_limit_hits[0] > 60.0:
             self.rate_limit_hits.popleft()
-        if self.rate_limit_since and (now - self.rate_limit_since) >= 60.0:
+        if self.rate_limit_since is not None and (now - self.rate_limit_since) >= 60.0:
             if self.rate_limit_callback and self.rate_limit_callback(self.primary_service, self.node_id):
                 self.rate_limit_since = None
                 self.rate_limit_hits.clear()
@@ -8684,41 +9493,52 @@ class RelayNode:
             self.rate_limit_hits.clear()
             self.last_rate_limit = None
 
-    def _send_simple_response(self, src: str, rid: str, resp: requests.Response, req: Optional[dict] = None) -> int:
+    @staticmethod
+    def _response_headers(resp: requests.Response) -> Tuple[Dict[str, str], str]:
+        """Lowercased header dict and lowercased Content-Type, built once per response."""
+        # CaseInsensitiveDict already keeps the lowercased keys.
+        headers = dict(resp.headers.lower_items())
+        return headers, (headers.get("content-type") or "").lower()
+
+    def _send_simple_response(self, src: str, rid: str, resp: requests.Response, req: Optional[dict] = None,
+                              meta: Optional[Tuple[Dict[str, str], str]] = None) -> int:
+        headers, content_type = meta or self._response_headers(resp)
         raw = resp.content or b""
         truncated = False
         if len(raw) > self.max_body:
-            raw = raw[: self.max_body]
+            # A view avoids copying the kept prefix just to base64 it.
+            raw = memoryview(raw)[: self.max_body]
             truncated = True
         payload = {
             "event": "relay.response",
             "id": rid,
             "ok": True,
             "status": int(resp.status_code),
-            "headers": {k.lower(): v for k, v in resp.headers.items()},
+            "headers": headers,
             "json": None,
             "body_b64": None,
             "truncated": truncated,
             "error": None,
         }
-        content_type = (resp.headers.get("Content-Type") or "").lower()
         if "application/json" in content_type:
             try:
-                parsed_json = resp.json()
+                try:
+                    parsed_json = _json_loads(resp.content)
+                except Exception:
+                    # Non-UTF-8 bodies, NaN literals, etc.: let requests sniff and decode.
+                    parsed_json = resp.json()
                 payload["json"] = self._sanitize_response_json(req, parsed_json)
             except Exception:
-                payload["body_b64"] = base64.b64encode(raw).decode("ascii")
-        elif len(raw) <= self.max_body:
-            payload["body_b64"] = base64.b64encode(raw).decode("ascii")
+                payload["body_b64"] = _b64encode(raw)
         else:
-            payload["body_b64"] = base64.b64encode(raw).decode("ascii")
+            payload["body_b64"] = _b64encode(raw)
         self._dm(src, payload, DM_OPTS_SINGLE)
         # Track stats with bytes sent and NKN address
         bytes_sent = len(raw)
-        self.ui.bump(self.node_id, "OUT", f"{payload['status']} {rid}", nkn_addr=src, bytes_sent=bytes_sent)
         service_name = self._canonical_service((req or {}).get("service") or (req or {}).get("target"))
-        origin = service_name or "service"
-        self._record_flow(origin, src, f"{payload['status']} {rid}", service=service_name, channel=src, direction="←")
+        label = f"{payload['status']} {rid}"
+        self._observe("OUT", label, flow=(service_name or "service", src, label), direction="←",
+                      service=service_name, channel=src, nkn_addr=src, bytes_sent=bytes_sent)
         return bytes_sent
 
     def _sanitize_response_json(self, req: Optional[dict], data: Any) -> Any:
@@ -8726,58 +9546,62 @@ class RelayNode:
             if not isinstance(data, (dict, list)):
                 return data
 
-            target = str((req or {}).get("service") or (req or {}).get("target") or "").lower()
-            path = str((req or {}).get("path") or "").lower()
-            url = str((req or {}).get("url") or "").lower()
-
-            def looks_like_show_payload(obj: Any, depth: int = 0) -> bool:
-                if depth > 3:
-                    return False
-                if isinstance(obj, dict):
-                    if any(isinstance(k, str) and k.lower() == "license" for k in obj.keys()):
-                        return True
-                    if "modelfile" in obj or "modelfile_sha" in obj:
-                        return True
-                    return any(looks_like_show_payload(v, depth + 1) for v in obj.values())
-                if isinstance(obj, list):
-                    return any(looks_like_show_payload(v, depth + 1) for v in obj)
+            req = req or {}
+
+            def looks_like_show_payload(root: Any) -> bool:
+                # Iterative scan of the top four levels; stops at the first hit.
+                stack = [(root, 0)]
+                while stack:
+                    obj, depth = stack.pop()
+                    if isinstance(obj, dict):
+                        if any(isinstance(k, str) and k.lower() == "license" for k in obj):
+                            return True
+                        if "modelfile" in obj or "modelfile_sha" in obj:
+                            return True
+                        children = obj.values()
+                    elif isinstance(obj, list):
+                        children = obj
+                    else:
+                        continue
+                    if depth < 3:
+                        stack.extend((v, depth + 1) for v in children if isinstance(v, (dict, list)))
                 return False
 
             maybe_show = False
-            if any(seg in target for seg in ("ollama", "llm")) and any(seg in path or seg in url for seg in ("/show", "/api/show")):
-                maybe_show = True
-            elif looks_like_show_payload(data):
-                maybe_show = True
+            target = str(req.get("service") or req.get("target") or "").lower()
+            if "ollama" in target or "llm" in target:
+                # "/api/show" contains "/show", so one probe covers both routes.
+                maybe_show = "/show" in str(req.get("path") or "").lower() or "/show" in str(req.get("url") or "").lower()
+            if not maybe_show:
+                maybe_show = looks_like_show_payload(data)
 
             if not maybe_show:
                 return data
 
-            def strip_license(obj: Any) -> Any:
+            # data was just parsed from the response body, so redact it in place.
+            stack = [data]
+            while stack:
+                obj = stack.pop()
                 if isinstance(obj, dict):
-                    new_obj = {}
-                    removed = False
-                    for key, value in obj.items():
-                        if isinstance(key, str) and key.lower() == "license":
-                            removed = True
-                            continue
-                        new_obj[key] = strip_license(value)
-                    if removed:
-                        new_obj["license"] = "[omitted]"
-                    return new_obj
-                if isinstance(obj, list):
-                    return [strip_license(item) for item in obj]
-                return obj
-
-            return strip_license(data)
+                    hits = [k for k in obj if isinstance(k, str) and k.lower() == "license"]
+                    for key in hits:
+                        del obj[key]
+                    if hits:
+                        obj["license"] = "[omitted]"
+                    stack.extend(v for v in obj.values() if isinstance(v, (dict, list)))
+                elif isinstance(obj, list):
+                    stack.extend(v for v in obj if isinstance(v, (dict, list)))
+            return data
         except Exception:
             return data
 
-    def _infer_stream_mode(self, mode: str, resp: requests.Response) -> str:
+    def _infer_stream_mode(self, mode: str, resp: requests.Response,
+                           meta: Optional[Tuple[Dict[str, str], str]] = None) -> str:
         if mode in ("lines", "ndjson", "line"):
             return "lines"
         if mode in ("sse", "events"):
             return "lines"
-        ctype = (resp.headers.get("Content-Type") or "").lower()
+        ctype = meta[1] if meta else (resp.headers.get("Content-Type") or "").lower()
         if "text/event-stream" in ctype or "application/x-ndjson" in ctype:
             return "lines"
         if "json" in ctype and "stream" in ctype:
@@ -8785,18 +9609,16 @@ class RelayNode:
         return "chunks"
 
     def _handle_stream(self, src: str, rid: str, resp: requests.Response, mode: str,
-                      service_name: Optional[str], bytes_in: int, start_ts: float) -> int:
-        headers = {k.lower(): v for k, v in resp.headers.items()}
+                      service_name: Optional[str], bytes_in: int, start_ts: float,
+                      meta: Optional[Tuple[Dict[str, str], str]] = None) -> int:
+        headers = (meta or self._response_headers(resp))[0]
         filename = None
-        cd = resp.headers.get("Content-Disposition") or resp.headers.get("content-disposition") or ""
+        cd = headers.get("content-disposition") or ""
         if cd:
-            import re
-            import urllib.parse
-
-            m = re.search(r"filename\*=UTF-8''([^;]+)|filename=\"?([^\";]+)\"?", cd, re.I)
+            m = CONTENT_DISPOSITION_FILENAME_RE.search(cd)
             if m:
                 filename = urllib.parse.unquote(m.group(1) or m.group(2))
-        cl_raw = resp.headers.get("Content-Length") or resp.headers.get("content-length")
+        cl_raw = headers.get("content-length")
         try:
             cl_num = int(cl_raw) if cl_raw is not None else None
         except Exception:
@@ -8822,8 +9644,9 @@ class RelayNode:
         return total_bytes
 
     def _stream_lines(self, src: str, rid: str, resp: requests.Response) -> int:
-        decoder = codecs.getincrementaldecoder("utf-8")()
-        text_buf = ""
+        # Raw bytes up to the last newline seen; b"\n" never splits a UTF-8
+        # sequence, so each completed line is decoded exactly once.
+        buf = bytearray()
         batch = []
         seq = 0
         total_bytes = 0
@@ -8851,19 +9674,20 @@ class RelayNode:
             for chunk in resp.iter_content(chunk_size=self.chunk_raw_b):
                 if chunk:
                     total_bytes += len(chunk)
-                    text_buf += decoder.decode(chunk)
+                    buf += chunk
+                    start = 0
                     while True:
-                        idx = text_buf.find("\n")
+                        idx = buf.find(b"\n", start)
                         if idx < 0:
                             break
-                        line = text_buf[:idx]
-                        text_buf = text_buf[idx + 1 :]
+                        line = buf[start:idx].decode("utf-8", "replace")
+                        start = idx + 1
                         if not line.strip():
                             continue
                         seq += 1
                         total_lines += 1
                         try:
-                            maybe = json.loads(line)
+                            maybe = _json_loads(line)
                             if isinstance(maybe, dict) and maybe.get("done") is True:
                                 done_seen = True
                         except Exception:
@@ -8878,6 +9702,8 @@ class RelayNode:
                             or (time.time() - last_flush) >= self.batch_latency
                         ):
                             flush_batch()
+                    if start:
+                        del buf[:start]
                 if time.time() >= hb_deadline:
                     self._dm(
                         src,
@@ -8890,8 +9716,8 @@ class RelayNode:
                     )
                     hb_deadline = time.time() + self.heartbeat_s
 
-            # flush any remaining text
-            tail = decoder.decode(b"", final=True)
+            # flush the unterminated last line, if any
+            tail = buf.decode("utf-8", "replace")
             if tail.strip():
                 seq += 1
                 total_lines += 1
@@ -8908,7 +9734,6 @@ class RelayNode:
                 flush_batch()
             except Exception:
                 pass
-            self.ui.bump(self.node_id, "ERR", f"stream lines {e}")
 
         end_payload = {
             "event": "relay.response.end",
@@ -8933,8 +9758,41 @@ class RelayNode:
         total = 0
         seq = 0
         last_send = time.time()
+        pending = bytearray()
+        pending_since = last_send
+        ok = True
+        error_msg = None
         cache_entry = {"chunks": {}, "created": time.time()}
-        self.response_cache[rid] = cache_entry
+        self._cache_response(rid, cache_entry)
+
+        def send_chunk(chunk: bytes) -> None:
+            nonlocal seq, last_send
+            seq += 1
+            payload = {
+                "event": "relay.response.chunk",
+                "id": rid,
+                "seq": seq,
+                "b64": _b64encode(chunk),
+            }
+            # Encode once; resend requests replay these exact bytes.
+            data = _json_dumps_bytes(payload)
+            cache_entry["chunks"][seq] = data
+            self._dm_encoded(src, "relay.response.chunk", data, DM_OPTS_STREAM)
+            last_send = time.time()
+
+        def flush_pending(force: bool) -> None:
+            # Split oversized reads (decoded content can exceed chunk_size) into
+            # chunk_raw_b-sized DMs; a remainder goes out when forced or once it
+            # has waited batch_latency.
+            nonlocal pending
+            size = self.chunk_raw_b
+            while len(pending) >= size:
+                send_chunk(bytes(pending[:size]))
+                del pending[:size]
+            if pending and (force or time.time() - pending_since >= self.batch_latency):
+                send_chunk(bytes(pending))
+                pending = bytearray()
+
         try:
             for chunk in resp.iter_content(chunk_size=self.chunk_raw_b):
                 if not chunk:
@@ -8943,48 +9801,78 @@ class RelayNode:
                         last_send = time.time()
                     continue
                 total += len(chunk)
-                seq += 1
-                b64 = base64.b64encode(chunk).decode("ascii")
-                payload = {
-                    "event": "relay.response.chunk",
-                    "id": rid,
-                    "seq": seq,
-                    "b64": b64,
-                }
-                cache_entry["chunks"][seq] = b64
-                self._dm(src, payload, DM_OPTS_STREAM)
-                last_send = time.time()
+                if not pending:
+                    pending_since = time.time()
+                pending += chunk
+                # A short read means the backend had nothing more at hand; the
+                # next read may block indefinitely, so don't hold the bytes.
+                flush_pending(len(chunk) < self.chunk_raw_b)
+            flush_pending(True)
         except Exception as e:
-            self._dm(src, {
-                "event": "relay.response.end",
-                "id": rid,
-                "ok": False,
-                "bytes": total,
-                "last_seq": seq,
-                "truncated": False,
-                "error": f"{type(e).__name__}: {e}",
-            }, DM_OPTS_STREAM)
-            self.ui.bump(self.node_id, "ERR", f"stream chunks {e}")
-            self.response_cache.pop(rid, None)
-            return
+            ok = False
+            error_msg = f"{type(e).__name__}: {e}"
+            with contextlib.suppress(Exception):
+                flush_pending(True)
+
+        # One end DM on either path; bytes_out accounting gets the count either way.
         self._dm(src, {
             "event": "relay.response.end",
             "id": rid,
-            "ok": True,
+            "ok": ok,
             "bytes": total,
             "last_seq": seq,
             "truncated": False,
-            "error": None,
+            "error": error_msg,
         }, DM_OPTS_STREAM)
-        # keep cache briefly for resend handling; cleanup after short delay
-        threading.Timer(5.0, lambda: self.response_cache.pop(rid, None)).start()
-        self.ui.bump(self.node_id, "OUT", f"stream end {rid}")
+        if ok:
+            # keep cache briefly for resend handling; the cleanup loop drops it after
+            cache_entry["expires_at"] = time.monotonic() + RESPONSE_CACHE_LINGER_S
+            self.ui.bump(self.node_id, "OUT", f"stream end {rid}")
+        else:
+            self.response_cache.pop(rid, None)
+            self.ui.bump(self.node_id, "ERR", f"stream chunks {error_msg}")
         return total
 
 
 # ──────────────────────────────────────────────────────────────
 # Router supervisor
 # ──────────────────────────────────────────────────────────────
+# Background config changes (seed rotation, reassignment) are coalesced into
+# at most one write per this many seconds.
+CONFIG_SAVE_DEBOUNCE_S = 2.0
+# Status monitor cadence: the poll interval backs off towards the maximum
+# while services and relay traffic are quiet, and snaps back on any change.
+STATUS_POLL_MIN_S = 5.0
+STATUS_POLL_MAX_S = 15.0
+PORT_SWEEP_INTERVAL_S = 30.0
+# struct linger {on, 0s}: close() aborts with RST instead of entering TIME_WAIT.
+_LINGER_ABORT = struct.pack("HH" if os.name == "nt" else "ii", 1, 0)
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Replace path with data so readers and crashes never see a partial file.
+
+    The temp file keeps the current file's permission bits (0600 for a new
+    file; the router config holds relay seeds) and is fsynced before the rename.
+    """
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o600
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        with contextlib.suppress(Exception):
+            tmp_path.unlink()
+        raise
+
+
 class Router:
     @staticmethod
     def _service_slug_static(service: str) -> str:
@@ -9003,6 +9891,7 @@ class Router:
     def __init__(self, cfg: dict, use_ui: bool):
         self.cfg: Dict[str, Any] = {}
         self.targets: Dict[str, str] = {}
+        self._target_cache: Dict[str, Tuple[str, str, str]] = {}
         self.feature_flags: Dict[str, bool] = {
             "router_control_plane_api": True,
             "resolver_auto_apply": True,
@@ -9012,6 +9901,10 @@ class Router:
         self.api_host = "127.0.0.1"
         self.api_port = 9071
         self.nkn_settings: Dict[str, Any] = {}
+        # Shared keep-alive pool for service RPC calls. RPCs come from many
+        # callers, so the session must not carry cookies between them.
+        self.rpc_session = RelayNode._new_session()
+        self.rpc_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
         self.cloudflared_enabled = True
         self.cloudflared_cfg: Dict[str, Any] = {}
         self.cloudflared_manager: Optional[CloudflaredManager] = None
@@ -9077,6 +9970,9 @@ class Router:
         self.catalog_runtime_overrides: Dict[str, Dict[str, Any]] = {}
         self.config_edit_lock = threading.Lock()
         self.config_dirty = False
+        self.config_save_lock = threading.Lock()
+        self.config_save_timer: Optional[threading.Timer] = None
+        self.config_written: Optional[bytes] = None  # last bytes _write_config put on disk
 
         self.use_ui = use_ui
         self.startup_time = time.time()
@@ -9104,6 +10000,10 @@ class Router:
         self.latest_service_status: Dict[str, dict] = {
             snap["name"]: snap for snap in self.watchdog.get_snapshot()
         }
+        # service -> last info dict handed to ui.update_service_info
+        self.published_service_info: Dict[str, dict] = {}
+        # service -> (log mtime_ns, log size, port detected from that log state)
+        self._log_port_cache: Dict[str, Tuple[int, int, Optional[int]]] = {}
         self.request_counter = {"value": 0}
         self.snapshot_lock = threading.Lock()
         self.snapshot_cache: Dict[str, Any] = {"ts_ms": 0, "services": {}, "resolved": {}, "stale": False}
@@ -9155,13 +10055,21 @@ class Router:
         self.assignment_lock = threading.Lock()
         self.config_dirty = bool(self.config_dirty)
         self.rate_limit_state: Dict[str, dict] = {}
+        # Seed rotations run one at a time on a single worker (see _on_rate_limit).
+        self.rotate_queue: "queue.Queue[str]" = queue.Queue()
+        self.rotate_lock = threading.Lock()
+        self.rotate_thread: Optional[threading.Thread] = None
         self.service_relays = self._ensure_service_relays()
         self.service_assignments = self._init_assignments()
+        self._sync_relay_sections()
 
-        self.nodes: List[RelayNode] = []
         self.service_nodes: Dict[str, RelayNode] = {}
-        self.node_map: Dict[str, RelayNode] = {}
+        self.node_map: Dict[str, RelayNode] = {}  # node_id -> node, in creation order
         self.node_addresses: Dict[str, Optional[str]] = {}
+        # Read-only copies of (service_assignments, node_addresses) for the
+        # per-request lookups; writers rebuild it under assignment_lock.
+        self._assign_view: Tuple[Dict[str, str], Dict[str, Optional[str]]] = ({}, {})
+        self._assign_fingerprint: Optional[Tuple[Any, ...]] = None
 
         self.stop = threading.Event()
         self.status_thread: Optional[threading.Thread] = None
@@ -9172,13 +10080,19 @@ class Router:
 
         for service_name, relay_cfg in self.service_relays.items():
             node = self._create_relay_node(service_name, relay_cfg)
-            self.nodes.append(node)
             self.node_map[node.node_id] = node
             self.service_nodes[service_name] = node
             self.node_addresses[node.node_id] = None
+        with self.assignment_lock:
+            self._publish_assign_view()
 
         self._refresh_node_assignments()
 
+    @property
+    def nodes(self) -> List[RelayNode]:
+        """Relay nodes in creation order (a fresh list; node_map is the registry)."""
+        return list(self.node_map.values())
+
     # Control plane + snapshot -------------------------------------------------
     @staticmethod
     def _as_bool(value: Any, default: bool = False) -> bool:
@@ -9439,6 +10353,7 @@ class Router:
         # Atomic assignment of runtime settings after full validation.
         self.cfg = next_cfg
         self.targets = next_targets
+        self._target_cache = self._build_target_cache()
         self.api_enabled = next_api_enabled
         self.api_host = next_api_host
         self.api_port = next_api_port
@@ -9559,7 +10474,7 @@ class Router:
     @staticmethod
     def _is_loopback_host(host: str) -> bool:
         host = (host or "").strip().lower()
-        return host in ("127.0.0.1", "localhost", "::1")
+        return host in _LOOPBACK_HOSTS
 
     @staticmethod
     def _canonical_router_service(hint: Any) -> str:
@@ -9568,12 +10483,7 @@ class Router:
             return ""
         if text in SERVICE_TARGETS:
             return text
-        for svc_name, info in SERVICE_TARGETS.items():
-            aliases = info.get("aliases", []) if isinstance(info, dict) else []
-            for alias in aliases:
-                if str(alias or "").strip().lower() == text:
-                    return svc_name
-        return text
+        return SERVICE_ALIAS_INDEX.get(text, text)
 
     def _default_service_publication_entry(
         self,
@@ -9722,7 +10632,7 @@ class Router:
         port = self.api_port
         local_base = f"http://127.0.0.1:{port}"
         urls = {"local": local_base}
-        if host and host not in ("127.0.0.1", "localhost", "::1"):
+        if host and host not in _LOOPBACK_HOSTS:
             urls["bind"] = f"http://{host}:{port}"
         if host in ("0.0.0.0", "::", ""):
             lan_ip = self._detect_lan_ip()
@@ -9783,9 +10693,9 @@ class Router:
             active_url = str(state.get("active_url") or "").strip()
             stale_url = str(state.get("stale_url") or "").strip()
             # Include NKN address for this service
-            with self.assignment_lock:
-                node_id = self.service_assignments.get(service_name)
-            nkn_addr = str(self.node_addresses.get(node_id) or "") if node_id else ""
+            assignments, addresses = self._assign_view
+            node_id = assignments.get(service_name)
+            nkn_addr = str(addresses.get(node_id) or "") if node_id else ""
             services[service_name] = {
                 "service": service_name,
                 "target_url": str(state.get("target_url") or "").strip(),
@@ -10912,10 +11822,11 @@ class Router:
         )
 
     def _pick_send_node(self) -> Optional[RelayNode]:
-        for node in self.nodes:
+        nodes = self.nodes
+        for node in nodes:
             if node.current_address:
                 return node
-        return self.nodes[0] if self.nodes else None
+        return nodes[0] if nodes else None
 
     def send_nkn_dm(self, target: str, payload: dict, tries: int = 1) -> Tuple[bool, str]:
         target = (target or "").strip()
@@ -11070,7 +11981,7 @@ class Router:
         request_b = int(self._payload_size_bytes(payload.get("json"))) if payload.get("json") is not None else 0
         if payload.get("body_b64") is not None:
             try:
-                request_b = max(request_b, len(base64.b64decode(str(payload.get("body_b64")), validate=False)))
+                request_b = max(request_b, len(_b64decode(str(payload.get("body_b64")))))
             except Exception:
                 request_b = max(request_b, 0)
         unit = str(
@@ -11349,7 +12260,7 @@ class Router:
             response_b = 0
             if body_b64:
                 try:
-                    response_b = len(base64.b64decode(str(body_b64), validate=False))
+                    response_b = len(_b64decode(str(body_b64)))
                 except Exception:
                     response_b = 0
             if response_b <= 0:
@@ -11514,7 +12425,7 @@ class Router:
             req["json"] = body.get("json")
         if body.get("body_b64") is not None:
             try:
-                raw = base64.b64decode(str(body.get("body_b64")), validate=False)
+                raw = _b64decode(str(body.get("body_b64")))
             except Exception:
                 raise ValueError("invalid body_b64 payload")
             if len(raw) > max_request_b:
@@ -11540,12 +12451,12 @@ class Router:
             params["json"] = req.get("json")
         elif req.get("body_b64") is not None:
             try:
-                params["data"] = base64.b64decode(str(req.get("body_b64")), validate=False)
+                params["data"] = _b64decode(str(req.get("body_b64")))
             except Exception:
                 params["data"] = b""
         max_response_b = int(self.nkn_settings.get("rpc_max_response_b") or (2 * 1024 * 1024))
         try:
-            with requests.request(method, url, **params) as resp:
+            with self.rpc_session.request(method, url, **params) as resp:
                 body = bytearray()
                 for chunk in resp.iter_content(chunk_size=64 * 1024):
                     if not chunk:
@@ -11555,27 +12466,27 @@ class Router:
                         return {
                             "ok": False,
                             "status": 413,
-                            "headers": {k.lower(): v for k, v in resp.headers.items()},
+                            "headers": dict(resp.headers.lower_items()),
                             "json": None,
                             "body_b64": None,
                             "error": f"rpc response too large ({len(body)} > {max_response_b})",
                         }
+                resp_headers, ctype = RelayNode._response_headers(resp)
                 payload: Dict[str, Any] = {
                     "ok": resp.status_code < 400,
                     "status": int(resp.status_code),
-                    "headers": {k.lower(): v for k, v in resp.headers.items()},
+                    "headers": resp_headers,
                     "json": None,
                     "body_b64": None,
                     "error": None,
                 }
-                ctype = (resp.headers.get("Content-Type") or "").lower()
                 if "application/json" in ctype:
                     try:
                         payload["json"] = json.loads(bytes(body).decode("utf-8", errors="replace"))
                     except Exception:
-                        payload["body_b64"] = base64.b64encode(bytes(body)).decode("ascii")
+                        payload["body_b64"] = _b64encode(body)
                 else:
-                    payload["body_b64"] = base64.b64encode(bytes(body)).decode("ascii")
+                    payload["body_b64"] = _b64encode(body)
                 return payload
         except Exception as exc:
             return {"ok": False, "status": 0, "headers": {}, "json": None, "body_b64": None, "error": f"{type(exc).__name__}: {exc}"}
@@ -14736,70 +15647,120 @@ class Router:
 
     # Port Detection -------------------------------------------
     def _detect_service_port(self, service_name: str) -> Optional[int]:
-        """Detect actual port a service is running on by parsing its log file."""
-        log_file = LOGS_ROOT / f"{service_name}.log"
-        if not log_file.exists():
-            return None
+        """Detect actual port a service is running on by parsing its log file.
 
+        The answer is cached against the log's mtime and size, so a sweep over
+        quiet services costs one stat() each.
+        """
+        log_file = SERVICE_LOG_PATHS.get(service_name) or LOGS_ROOT / f"{service_name}.log"
         try:
-            import re
-
-            # Read last 100 lines of log file (most recent startup info)
-            with open(log_file, 'r') as f:
-                lines = f.readlines()[-100:]
-
-            # Look for common port announcement patterns
-            patterns = [
-                r'Running on .*:(\d+)',  # Flask: "Running on http://127.0.0.1:5000"
-                r'listening on .*:(\d+)',  # Generic: "listening on 0.0.0.0:8080"
-                r'Listening on port (\d+)',  # Generic: "Listening on port 8080"
-                r'Server.*port (\d+)',  # Generic: "Server started on port 8080"
-                r'Started.*:(\d+)',  # Generic: "Started on :8080"
-                r'http://[^:]+:(\d+)',  # URL pattern: "http://127.0.0.1:8080"
-            ]
-
-            for line in reversed(lines):  # Start from most recent
-                for pattern in patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        port = int(match.group(1))
-                        # Sanity check: port should be in reasonable range
-                        if 1024 <= port <= 65535:
-                            return port
-
+            st = log_file.stat()
+        except OSError:
             return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._log_port_cache.get(service_name)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+
+        try:
+            # Last 100 lines (most recent startup info), read backwards from EOF
+            # so the cost does not grow with the log.
+            port = _port_from_log_text(_tail_text(log_file, 100))
         except Exception as e:
             LOGGER.debug(f"Port detection failed for {service_name}: {e}")
             return None
+        self._log_port_cache[service_name] = (*stamp, port)
+        return port
 
-    def _service_host_hint(self, service_name: str) -> str:
-        info = SERVICE_TARGETS.get(service_name) or {}
-        target_key = info.get("target") or service_name
-        base = self.targets.get(target_key) or info.get("endpoint") or DEFAULT_TARGETS.get(target_key) or ""
-        try:
-            parsed = urllib.parse.urlparse(base)
-            return parsed.hostname or "127.0.0.1"
-        except Exception:
-            return "127.0.0.1"
+    def _build_target_cache(self) -> Dict[str, Tuple[str, str, str]]:
+        """Resolve (target_key, scheme, host) per service for port alignment.
 
-    def _probe_service_port(self, host: str, port: int, timeout: float = 0.35) -> bool:
-        try:
-            import socket
+        Port updates only ever rewrite the port of a base URL, so this only
+        needs rebuilding when self.targets is replaced wholesale.
+        """
+        cache: Dict[str, Tuple[str, str, str]] = {}
+        for service_name, info in SERVICE_TARGETS.items():
+            target_key = info.get("target") or service_name
+            base = self.targets.get(target_key) or info.get("endpoint") or ""
+            host, scheme = "127.0.0.1", "http"
+            try:
+                hint = _parse_url(base or DEFAULT_TARGETS.get(target_key) or "")
+                host = hint.hostname or host
+                if base:
+                    scheme = _parse_url(base).scheme or scheme
+            except Exception:
+                pass
+            cache[service_name] = (target_key, scheme, host)
+        return cache
 
-            with socket.create_connection((host, port), timeout=timeout):
-                return True
-        except Exception:
-            return False
+    def _probe_many(self, targets: List[Tuple[str, int]], timeout: float = 0.35) -> Dict[Tuple[str, int], bool]:
+        """TCP-probe several host:port pairs concurrently within one timeout window.
+
+        Connects are started non-blocking on every resolved address (so a
+        "localhost" that resolves to ::1 and 127.0.0.1 is tried on both, as
+        create_connection would) and a pair counts as listening if any of its
+        sockets completes the handshake. Sockets linger 0, so closing one sends
+        RST: a sweep leaves no TIME_WAIT entries behind.
+        """
+        results: Dict[Tuple[str, int], bool] = {target: False for target in targets}
+        in_progress = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, getattr(errno, "WSAEWOULDBLOCK", -1)}
+        sel = selectors.DefaultSelector()
+        try:
+            for target in results:
+                try:
+                    infos = socket.getaddrinfo(target[0], target[1], type=socket.SOCK_STREAM)
+                except OSError:
+                    continue
+                for family, socktype, proto, _, addr in infos:
+                    try:
+                        sock = socket.socket(family, socktype, proto)
+                    except OSError:
+                        continue
+                    sock.setblocking(False)
+                    with contextlib.suppress(OSError):
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_ABORT)
+                    err = sock.connect_ex(addr)
+                    if err == 0:
+                        results[target] = True
+                        sock.close()
+                    elif err in in_progress:
+                        sel.register(sock, selectors.EVENT_WRITE, target)
+                    else:
+                        sock.close()
+            deadline = time.monotonic() + timeout
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(remaining):
+                    sock = key.fileobj
+                    sel.unregister(sock)
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        results[key.data] = True
+                    sock.close()
+        finally:
+            for key in list(sel.get_map().values()):
+                key.fileobj.close()
+            sel.close()
+        return results
 
     def _update_service_ports(self):
         """Update SERVICE_TARGETS with detected ports from running services."""
+        detected: Dict[str, int] = {}
         for service_name in SERVICE_TARGETS.keys():
             detected_port = self._detect_service_port(service_name)
-            if not detected_port:
-                continue
+            if detected_port:
+                detected[service_name] = detected_port
+        # One shared probe window for every service instead of one per service.
+        listening = (
+            self._probe_many([(self._target_cache[name][2], port) for name, port in detected.items()])
+            if detected
+            else {}
+        )
 
-            host = self._service_host_hint(service_name)
-            if not self._probe_service_port(host, detected_port):
+        for service_name, detected_port in detected.items():
+            target_key, scheme, host = self._target_cache[service_name]
+            if not listening.get((host, detected_port)):
                 LOGGER.debug("Skipping port update for %s: %s not listening on %s", service_name, host, detected_port)
                 continue
 
@@ -14818,21 +15779,15 @@ class Router:
                 LOGGER.debug(f"Updated {service_name} endpoint to port {detected_port}")
 
             # Update router targets/config to match detected port (no hard-coding)
-            target_key = SERVICE_TARGETS[service_name].get("target") or service_name
             existing_base = self.targets.get(target_key) or SERVICE_TARGETS[service_name].get("endpoint") or ""
-            try:
-                parsed = urllib.parse.urlparse(existing_base or f"http://{host}:{detected_port}")
-                host = parsed.hostname or host or "127.0.0.1"
-                scheme = parsed.scheme or "http"
-                new_base = f"{scheme}://{host}:{detected_port}"
-                if new_base != existing_base:
-                    self.targets[target_key] = new_base
-                    self.cfg.setdefault("targets", {})[target_key] = new_base
-                    self.config_dirty = True
-                    self.ui.update_service_info(service_name, {"endpoint": new_base})
-                    LOGGER.info("Aligned target for %s -> %s", target_key, new_base)
-            except Exception as exc:
-                LOGGER.debug("Failed to align target for %s: %s", target_key, exc)
+            url_host = f"[{host}]" if ":" in host else host
+            new_base = f"{scheme}://{url_host}:{detected_port}"
+            if new_base != existing_base:
+                self.targets[target_key] = new_base
+                self.cfg.setdefault("targets", {})[target_key] = new_base
+                self.config_dirty = True
+                self.ui.update_service_info(service_name, {"endpoint": new_base})
+                LOGGER.info("Aligned target for %s -> %s", target_key, new_base)
         self._sync_cloudflared_tunnels()
 
     def start(self):
@@ -14905,6 +15860,9 @@ class Router:
         self.watchdog.shutdown()
         if self.status_thread and self.status_thread.is_alive():
             self.status_thread.join(timeout=5)
+        timer = self.config_save_timer
+        if timer:
+            timer.cancel()
         if not self.config_dirty:
             return
         self._save_config()
@@ -14928,10 +15886,7 @@ class Router:
         legacy_nodes = {node.get("name"): node for node in self.cfg.get("nodes", []) if node.get("name")}
         changed = False
         now = int(time.time())
-        valid_services = {definition.name for definition in ServiceWatchdog.DEFINITIONS}
-
-        for definition in ServiceWatchdog.DEFINITIONS:
-            svc = definition.name
+        for svc in SERVICE_NAMES:
             entry = dict(relays.get(svc, {}))
             seed = (entry.get("seed_hex") or "").strip()
             if not seed:
@@ -14952,7 +15907,7 @@ class Router:
             relays[svc] = entry
 
         for svc in list(relays.keys()):
-            if svc not in valid_services:
+            if svc not in SERVICE_NAME_SET:
                 relays.pop(svc, None)
                 changed = True
 
@@ -14963,8 +15918,7 @@ class Router:
     def _init_assignments(self) -> Dict[str, str]:
         assignments = self.cfg.setdefault("service_assignments", {})
         changed = False
-        for definition in ServiceWatchdog.DEFINITIONS:
-            svc = definition.name
+        for svc in SERVICE_NAMES:
             relay_entry = self.service_relays.get(svc, {})
             desired = relay_entry.get("name") or svc
             if assignments.get(svc) != desired:
@@ -14977,20 +15931,59 @@ class Router:
         self.config_dirty = changed
         return assignments
 
+    def _sync_relay_sections(self) -> None:
+        """Rebuild the config's service_assignments/nodes from service_relays."""
+        self.cfg["service_relays"] = self.service_relays
+        self.cfg["service_assignments"] = {
+            svc: entry.get("name") or svc for svc, entry in self.service_relays.items()
+        }
+        self.cfg["nodes"] = [
+            {"name": entry.get("name") or svc, "seed_hex": entry.get("seed_hex")}
+            for svc, entry in self.service_relays.items()
+        ]
+
+    def _set_relay_entry(self, service: str, entry: dict) -> None:
+        """Replace one service's relay entry and its derived config rows in place."""
+        known = service in self.service_relays
+        self.service_relays[service] = entry
+        nodes = self.cfg.get("nodes")
+        index = list(self.service_relays).index(service)
+        if not known or not isinstance(nodes, list) or index >= len(nodes):
+            self._sync_relay_sections()
+            return
+        name = entry.get("name") or service
+        self.cfg.setdefault("service_assignments", {})[service] = name
+        nodes[index] = {"name": name, "seed_hex": entry.get("seed_hex")}
+
+    def _schedule_config_save(self) -> None:
+        """Mark the config dirty and write it once CONFIG_SAVE_DEBOUNCE_S has passed.
+
+        Changes made while a write is pending ride along with it; shutdown()
+        flushes anything still dirty.
+        """
+        with self.config_save_lock:
+            self.config_dirty = True
+            if self.config_save_timer is not None:
+                return
+            timer = threading.Timer(CONFIG_SAVE_DEBOUNCE_S, self._flush_config)
+            timer.daemon = True
+            self.config_save_timer = timer
+        timer.start()
+
+    def _flush_config(self) -> None:
+        with self.config_save_lock:
+            self.config_save_timer = None
+            if self.config_dirty and not self.stop.is_set():
+                self._write_config()
+
     def _save_config(self):
+        with self.config_save_lock:
+            self._write_config()
+
+    def _write_config(self):
         try:
+            # service_assignments/nodes are kept current by _set_relay_entry.
             self.cfg["service_relays"] = self.service_relays
-            self.cfg["service_assignments"] = {
-                svc: self.service_relays.get(svc, {}).get("name") or svc
-                for svc in self.service_relays
-            }
-            self.cfg["nodes"] = [
-                {
-                    "name": entry.get("name") or svc,
-                    "seed_hex": entry.get("seed_hex"),
-                }
-                for svc, entry in self.service_relays.items()
-            ]
             normalized, changed, warnings, errors = _normalize_router_config(self.cfg)
             for warning in warnings:
                 LOGGER.warning("Config save migration: %s", warning)
@@ -14999,20 +15992,31 @@ class Router:
                 raise ValueError(f"config validation failed before save: {details}")
             if changed:
                 self.cfg = normalized
-            CONFIG_PATH.write_text(json.dumps(normalized, indent=2))
+            data = _json_dumps_pretty(normalized)
+            if data != self.config_written:
+                _write_bytes_atomic(CONFIG_PATH, data)
+                self.config_written = data
+                LOGGER.info("Config saved to %s", CONFIG_PATH)
             self.config_dirty = False
-            LOGGER.info("Config saved to %s", CONFIG_PATH)
         except Exception as exc:
             LOGGER.warning("Failed to write config %s: %s", CONFIG_PATH, exc)
 
     def _refresh_node_assignments(self):
-        mapping: Dict[str, List[str]] = {node.node_id: [] for node in self.nodes}
-        with self.assignment_lock:
-            for service, node_id in self.service_assignments.items():
-                mapping.setdefault(node_id, []).append(service)
+        view = self._assign_view
+        node_ids = tuple(self.node_map)
+        # Address updates and rotations often leave the assignment set as it
+        # was; only push to the UI when nodes, assignments or addresses moved.
+        fingerprint = (node_ids, view)
+        if fingerprint == self._assign_fingerprint:
+            return
+        self._assign_fingerprint = fingerprint
+        mapping: Dict[str, List[str]] = {node_id: [] for node_id in node_ids}
+        assignments, _ = view
+        for service, node_id in assignments.items():
+            mapping.setdefault(node_id, []).append(service)
         for node_id, services in mapping.items():
             self.ui.set_node_services(node_id, sorted(services))
-        for service in self.service_assignments.keys():
+        for service in assignments:
             self._publish_assignment(service)
 
     def _build_targets_for_service(self, service: str, relay_cfg: dict) -> Dict[str, str]:
@@ -15033,16 +16037,10 @@ class Router:
         return {alias: base_url for alias in info.get("aliases", [service])}
 
     def _build_aliases_for_service(self, service: str, relay_cfg: dict) -> List[str]:
-        aliases = list(dict.fromkeys(relay_cfg.get("aliases", [])))
-        if aliases:
-            return aliases
-        info = SERVICE_TARGETS.get(service)
-        if not info:
-            return [service]
-        ordered = list(info.get("aliases", []))
-        if service not in ordered:
-            ordered.append(service)
-        return list(dict.fromkeys(ordered))
+        override = relay_cfg.get("aliases")
+        if override:
+            return list(dict.fromkeys(override))
+        return list(_default_aliases(service))
 
     def _create_relay_node(self, service: str, relay_cfg: dict) -> RelayNode:
         node_cfg = dict(relay_cfg)
@@ -15063,14 +16061,31 @@ class Router:
         )
 
     def _on_rate_limit(self, service: str, node_id: str) -> bool:
-        state = self.rate_limit_state.setdefault(service, {"pending": False})
-        if state.get("pending"):
-            return False
-        state["pending"] = True
+        with self.rotate_lock:
+            state = self.rate_limit_state.setdefault(service, {"pending": False})
+            if state.get("pending"):
+                return False
+            state["pending"] = True
+            if not self.rotate_thread or not self.rotate_thread.is_alive():
+                self.rotate_thread = threading.Thread(target=self._rotation_worker, daemon=True, name="relay-rotate")
+                self.rotate_thread.start()
         LOGGER.warning("Service %s on relay %s experiencing sustained 429 responses; rotating seed", service, node_id)
-        threading.Thread(target=self._rotate_service_address, args=(service,), daemon=True).start()
+        self.rotate_queue.put(service)
         return True
 
+    def _rotation_worker(self) -> None:
+        # A 429 storm across services queues here instead of spawning a thread
+        # per service that then contend on assignment_lock and the config file.
+        while not self.stop.is_set():
+            try:
+                service = self.rotate_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            try:
+                self._rotate_service_address(service)
+            except Exception as exc:
+                LOGGER.warning("Seed rotation for %s failed: %s", service, exc)
+
     def _rotate_service_address(self, service: str) -> None:
         node = self.service_nodes.get(service)
         state = self.rate_limit_state.setdefault(service, {})
@@ -15082,33 +16097,32 @@ class Router:
             old_node_id = node.node_id
             with self.assignment_lock:
                 self.node_addresses.pop(old_node_id, None)
-            self.nodes = [n for n in self.nodes if n is not node]
+                self._publish_assign_view()
             self.node_map.pop(old_node_id, None)
             entry = dict(self.service_relays.get(service, {}))
             new_seed = generate_seed_hex()
             entry["seed_hex"] = new_seed.lower().replace("0x", "")
             entry["name"] = self._relay_name_for_seed(service, entry["seed_hex"])
             entry["rotated_at"] = int(time.time())
-            self.service_relays[service] = entry
+            self._set_relay_entry(service, entry)
             new_node = self._create_relay_node(service, entry)
-            self.nodes.append(new_node)
             self.node_map[new_node.node_id] = new_node
             self.service_nodes[service] = new_node
-            self.node_addresses[new_node.node_id] = None
             with self.assignment_lock:
+                self.node_addresses[new_node.node_id] = None
                 self.service_assignments[service] = new_node.node_id
+                self._publish_assign_view()
             new_node.start()
             self._refresh_node_assignments()
-            self.config_dirty = True
-            self._save_config()
+            self._schedule_config_save()
         finally:
             state["pending"] = False
 
     def _publish_assignment(self, service: str):
         status = self.latest_service_status.get(service, {})
-        with self.assignment_lock:
-            node_id = self.service_assignments.get(service)
-        addr = self.node_addresses.get(node_id)
+        assignments, addresses = self._assign_view
+        node_id = assignments.get(service)
+        addr = addresses.get(node_id)
         info = dict(status)
         running = info.get("running")
         info["status"] = info.get("status") or ("running" if running else info.get("last_error") or "stopped")
@@ -15130,10 +16144,39 @@ class Router:
             info.setdefault("tunnel_state", "inactive")
             info.setdefault("tunnel_running", False)
             info.setdefault("tunnel_error", "")
-        self.ui.update_service_info(service, info)
+        # The UI merges what it is given, so only changed fields need to go out;
+        # an idle service costs no UI update (or redraw) per status tick.
+        last = self.published_service_info.get(service)
+        delta = info if last is None else {k: v for k, v in info.items() if k not in last or last[k] != v}
+        if not delta:
+            return
+        self.published_service_info[service] = info
+        self.ui.update_service_info(service, delta)
+
+    def _status_fingerprint(self, snapshot: List[Dict[str, object]]) -> Tuple[Any, ...]:
+        services = tuple(
+            (
+                entry.get("name"),
+                entry.get("state"),
+                entry.get("state_reason"),
+                entry.get("running"),
+                entry.get("pid"),
+                entry.get("desired_enabled"),
+                entry.get("last_state_change_at"),
+            )
+            for entry in snapshot
+        )
+        with self.telemetry_lock:
+            traffic = (
+                self.telemetry_state.get("inbound_messages", 0),
+                self.telemetry_state.get("outbound_messages", 0),
+            )
+        return services, traffic
 
     def _status_monitor(self):
-        port_detection_counter = 0
+        interval = STATUS_POLL_MIN_S
+        last_fingerprint: Optional[Tuple[Any, ...]] = None
+        next_port_sweep = time.monotonic() + PORT_SWEEP_INTERVAL_S
         while not self.stop.is_set():
             try:
                 snapshot = self.watchdog.get_snapshot()
@@ -15141,11 +16184,16 @@ class Router:
                     self.latest_service_status[entry["name"]] = entry
                     self._publish_assignment(entry["name"])
 
-                # Update service ports every 30 seconds (5s * 6 iterations)
-                port_detection_counter += 1
-                if port_detection_counter >= 6:
+                fingerprint = self._status_fingerprint(snapshot)
+                if fingerprint == last_fingerprint:
+                    interval = min(interval * 1.5, STATUS_POLL_MAX_S)
+                else:
+                    interval = STATUS_POLL_MIN_S
+                last_fingerprint = fingerprint
+
+                if time.monotonic() >= next_port_sweep:
                     self._update_service_ports()
-                    port_detection_counter = 0
+                    next_port_sweep = time.monotonic() + PORT_SWEEP_INTERVAL_S
                 self._sync_cloudflared_tunnels()
                 with contextlib.suppress(Exception):
                     ui_snapshot = self.get_service_snapshot(force_refresh=False)
@@ -15194,27 +16242,35 @@ class Router:
                 self._sample_telemetry()
             except Exception as exc:
                 LOGGER.debug("Status monitor error: %s", exc)
-            time.sleep(5)
+                interval = STATUS_POLL_MIN_S
+            self.stop.wait(interval)
 
     def _update_node_address(self, node_id: str, addr: Optional[str]):
-        self.node_addresses[node_id] = addr
+        with self.assignment_lock:
+            self.node_addresses[node_id] = addr
+            self._publish_assign_view()
         self._refresh_node_assignments()
 
+    def _publish_assign_view(self) -> None:
+        # Caller holds assignment_lock. Readers take self._assign_view without
+        # locking; rebinding the attribute swaps both maps in one step.
+        self._assign_view = (dict(self.service_assignments), dict(self.node_addresses))
+
     # ──────────────────────────────────────────
     # Assignment lookup & UI actions
     # ──────────────────────────────────────────
     def lookup_assignment(self, service_name: str):
-        with self.assignment_lock:
-            if service_name == "__map__":
-                result = {}
-                for svc, node_id in self.service_assignments.items():
-                    result[svc] = {
-                        "node": node_id,
-                        "addr": self.node_addresses.get(node_id),
-                    }
-                return result
-            node_id = self.service_assignments.get(service_name)
-        addr = self.node_addresses.get(node_id)
+        assignments, addresses = self._assign_view
+        if service_name == "__map__":
+            result = {}
+            for svc, node_id in assignments.items():
+                result[svc] = {
+                    "node": node_id,
+                    "addr": addresses.get(node_id),
+                }
+            return result
+        node_id = assignments.get(service_name)
+        addr = addresses.get(node_id)
         return (node_id, addr)
 
     def handle_ui_action(self, action: dict):
@@ -15278,7 +16334,7 @@ class Router:
         if not service or service not in self.latest_service_status:
             return
         with self.assignment_lock:
-            node_ids = [node.node_id for node in self.nodes]
+            node_ids = list(self.node_map)
             if not node_ids:
                 return
             current = self.service_assignments.get(service)
@@ -15290,10 +16346,11 @@ class Router:
             if self.service_assignments.get(service) == new_id:
                 return
             self.service_assignments[service] = new_id
+            self._publish_assign_view()
             self.config_dirty = True
         LOGGER.info("Reassigned %s to %s", service, new_id)
         self._refresh_node_assignments()
-        self._save_config()
+        self._schedule_config_save()
 
 
 
@@ -31,10 +31,8 @@ try:
         '_safe_addstr', '_draw_box'
     ]
 
-    missing = []
-    for method in required_methods:
-        if not hasattr(ui, method):
-            missing.append(method)
+    ui_attrs = set(dir(ui))
+    missing = [method for method in required_methods if method not in ui_attrs]
 
     if missing:
         print(f"✗ Missing methods: {', '.join(missing)}")
@@ -49,10 +47,7 @@ try:
         'set_daemon_info', 'bump', 'run', 'shutdown', 'set_chunk_upload_kb'
     ]
 
-    missing_api = []
-    for method in api_methods:
-        if not hasattr(ui, method):
-            missing_api.append(method)
+    missing_api = [method for method in api_methods if method not in ui_attrs]
 
     if missing_api:
         print(f"✗ Missing API methods: {', '.join(missing_api)}")
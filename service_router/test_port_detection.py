@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test port detection functionality."""
 
+import os
+import re
 import sys
 import tempfile
 from pathlib import Path
@@ -8,8 +10,17 @@ from pathlib import Path
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
-    from router import Router, SERVICE_TARGETS, LOGS_ROOT
+# "Running on <url>:<port>" and "Listening on port <port>" in one pass.
+_PORT_PATTERN = re.compile(rb'(?:Running on \S*:|Listening on port )(\d{4,5})\b', re.IGNORECASE)
+# Lowercased literals every match must contain; a plain substring search for
+# them rules out a log before the regex engine is started at all.
+_PORT_LITERALS = (b"running on ", b"listening on port ")
+# Port validation verdict labels, indexed by the allowed bool.
+_VERDICTS = ("BLOCK", "ALLOW")
+
+
+def main():
+    from router import Router, SERVICE_TARGETS, SERVICE_LOG_PATHS, LOGS_ROOT, _port_of_url
 
     print("="*60)
     print("Port Detection Test")
@@ -17,33 +28,44 @@ try:
 
     # Test 1: Check port ranges are configured
     print("\n1. Checking port range configuration...")
+    port_ranges = {}  # service -> "lo-hi", reused by Test 2
     for service_name, config in SERVICE_TARGETS.items():
-        ports = config.get("ports", [])
+        ports = sorted(config.get("ports", []))
+        port_ranges[service_name] = f"{ports[0]}-{ports[-1]}" if ports else "none"
         endpoint = config.get("endpoint", "")
-        print(f"  {service_name}:")
-        print(f"    - Port range: {min(ports)}-{max(ports)} ({len(ports)} ports)")
-        print(f"    - Endpoint: {endpoint}")
+        print(
+            f"  {service_name}:\n"
+            f"    - Port range: {port_ranges[service_name]} ({len(ports)} ports)\n"
+            f"    - Endpoint: {endpoint}"
+        )
 
     # Test 2: Verify depth_any has port 5002 in range
     print("\n2. Verifying depth_any port range includes 5002...")
     depth_ports = SERVICE_TARGETS["depth_any"]["ports"]
     if 5002 in depth_ports:
-        print(f"  ✓ Port 5002 is in depth_any whitelist ({min(depth_ports)}-{max(depth_ports)})")
+        print(f"  ✓ Port 5002 is in depth_any whitelist ({port_ranges['depth_any']})")
     else:
         print(f"  ✗ Port 5002 NOT in depth_any whitelist!")
         sys.exit(1)
 
     # Test 3: Check log file exists
     print("\n3. Checking for service log files...")
+    # One directory listing instead of a stat() per service; is_file/is_dir
+    # follow symlinks, so a dangling link counts as missing like exists() did.
+    try:
+        with os.scandir(LOGS_ROOT) as entries:
+            present = {entry.name for entry in entries if entry.is_file() or entry.is_dir()}
+    except OSError:
+        present = set()
     for service_name in SERVICE_TARGETS.keys():
-        log_file = LOGS_ROOT / f"{service_name}.log"
-        exists = log_file.exists()
+        log_file = SERVICE_LOG_PATHS[service_name]
+        exists = log_file.name in present
         status = "✓" if exists else "✗"
         print(f"  {status} {service_name}: {log_file} {'(exists)' if exists else '(not found)'}")
 
     # Test 4: Test port detection pattern matching
     print("\n4. Testing port detection patterns...")
-    test_log_content = """
+    test_log_content = b"""
     [2025-12-04 22:00:00] Starting service...
      * Running on http://127.0.0.1:5002
      * Running on http://192.168.1.47:5002
@@ -51,27 +73,20 @@ try:
     """
 
     # Create a temporary log file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+    with tempfile.NamedTemporaryFile(suffix='.log', delete=False) as f:
         f.write(test_log_content)
         temp_log = Path(f.name)
 
     try:
         # Test regex patterns
-        import re
-        patterns = [
-            r'Running on .*:(\d+)',
-            r'Listening on port (\d+)',
-        ]
-
-        detected_ports = set()
-        with open(temp_log, 'r') as f:
-            for line in f:
-                for pattern in patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        port = int(match.group(1))
-                        if 1024 <= port <= 65535:
-                            detected_ports.add(port)
+        log_bytes = temp_log.read_bytes()
+        lowered = log_bytes.lower()
+        raw_ports = set()
+        if any(literal in lowered for literal in _PORT_LITERALS):
+            # Dedupe the matched digit strings first; int() then runs once per
+            # distinct port rather than once per announcement.
+            raw_ports = {match.group(1) for match in _PORT_PATTERN.finditer(log_bytes)}
+        detected_ports = {port for port in map(int, raw_ports) if 1024 <= port <= 65535}
 
         if 5002 in detected_ports:
             print(f"  ✓ Successfully detected port 5002 from log patterns")
@@ -83,7 +98,13 @@ try:
 
     # Test 5: Test port validation logic
     print("\n5. Testing port validation logic...")
-    from urllib.parse import urlparse
+    # port -> every service name/alias whose whitelist includes it, so each
+    # URL is answered with one lookup instead of a walk over all services.
+    port_to_services = {}
+    for name, cfg in SERVICE_TARGETS.items():
+        names = {name, *cfg.get("aliases", [])}
+        for port in cfg.get("ports", []):
+            port_to_services.setdefault(port, set()).update(names)
 
     test_urls = [
         ("http://127.0.0.1:5000/api/test", "depth_any", True),
@@ -96,20 +117,15 @@ try:
     ]
 
     for url, service, should_allow in test_urls:
-        parsed = urlparse(url)
-        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        # Same (cached) lookup the router's _validate_url_port uses.
+        port = _port_of_url(url)
 
         # Check if port is in service whitelist
-        allowed = False
-        for svc_key, target_info in SERVICE_TARGETS.items():
-            if service == svc_key or service in target_info.get("aliases", []):
-                if port in target_info.get("ports", []):
-                    allowed = True
-                    break
+        allowed = service in port_to_services.get(port, ())
 
         status = "✓" if (allowed == should_allow) else "✗"
-        result = "ALLOW" if allowed else "BLOCK"
-        expected = "ALLOW" if should_allow else "BLOCK"
+        result = _VERDICTS[allowed]
+        expected = _VERDICTS[should_allow]
         print(f"  {status} {url} → {result} (expected: {expected})")
 
         if allowed != should_allow:
@@ -127,8 +143,17 @@ try:
     print("  • Fallback to port ranges prevents false positives")
     print("\nThe port isolation feature now works with dynamic port allocation!")
 
-except Exception as e:
-    print(f"✗ Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+
+if __name__ == "__main__":
+    # Block-buffer stdout even on a terminal: the report is written in a few
+    # large writes and flushed on exit instead of one write(2) per line.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    try:
+        main()
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        sys.stdout.flush()  # keep the summary ahead of the traceback on stderr
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -88,7 +88,7 @@ def _make_router_for_api(snapshot: dict | None = None) -> router.Router:
         "endpoint_hits": {},
         "history": deque(maxlen=240),
     }
-    r.nodes = [SimpleNamespace(current_address="router.test.addr")]
+    r.node_map = {"router-test-node": SimpleNamespace(node_id="router-test-node", current_address="router.test.addr")}
     r.nkn_settings = {
         "enable": True,
         "resolve_timeout_seconds": 20,
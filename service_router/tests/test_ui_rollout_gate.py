@@ -107,3 +107,30 @@ def test_gate_e_no_ui_stdout_path_remains_functional():
     text = buf.getvalue()
     assert "qa-message" in text
     assert "IN" in text
+
+
+def test_simple_response_books_client_address_and_bytes():
+    ui = _mk_ui()
+    ui.services = {"ollama": {}}
+    calls = []
+
+    class _Stats:
+        def touch_address(self, addr, service=None):
+            pass
+
+        def record_request(self, service, addr, **kwargs):
+            calls.append((service, addr, kwargs))
+
+    ui.stats = _Stats()
+    relay = router.RelayNode.__new__(router.RelayNode)
+    relay.node_id = "ollama-relay-qa"
+    relay.ui = ui
+    relay.max_body = 1 << 20
+    relay._dm = lambda *args, **kwargs: None
+    resp = SimpleNamespace(content=b"hello", status_code=200)
+    meta = ({"content-type": "text/plain"}, "text/plain")
+
+    sent = relay._send_simple_response("client.abc", "rid-1", resp, None, meta=meta)
+
+    assert sent == 5
+    assert calls == [("ollama", "client.abc", {"bytes_out": 5, "bytes_in": 0, "duration_s": 0.0})]